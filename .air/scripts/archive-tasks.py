@@ -8,15 +8,19 @@ Example: python archive-tasks.py 2024-Q4
 """
 
 import sys
+import os
 import re
+import errno
 import subprocess
 from pathlib import Path
 from datetime import datetime, timedelta
 from shutil import move
+from functools import lru_cache
 
 
+@lru_cache(maxsize=1)
 def is_git_repo():
-    """Check if current directory is in a git repository"""
+    """Check if current directory is in a git repository (checked once per run)"""
     try:
         result = subprocess.run(
             ['git', 'rev-parse', '--git-dir'],
@@ -29,30 +33,80 @@ def is_git_repo():
         return False
 
 
-def git_move(source, dest):
+def open_dir_fd(path):
+    """Open a directory fd for os.rename(dst_dir_fd=...), or None if unsupported"""
+    if os.rename not in os.supports_dir_fd:
+        return None
+    try:
+        return os.open(path, os.O_RDONLY | getattr(os, 'O_DIRECTORY', 0))
+    except OSError:
+        return None
+
+
+def rename_into(source, dest_dir, dest_dir_fd):
+    """Move source into dest_dir, using a single rename when possible"""
+    name = os.path.basename(source)
+    if dest_dir_fd is not None:
+        try:
+            os.rename(source, name, dst_dir_fd=dest_dir_fd)
+            return
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+
+    # Fall back to regular file system move (e.g. across filesystems)
+    move(str(source), os.path.join(dest_dir, name))
+
+
+def git_move_many(sources, dest_dir):
     """
-    Move file using git mv if in a git repo, otherwise use regular move.
-    Returns True if successful, False otherwise.
+    Move files into dest_dir with a single git mv if in a git repo,
+    otherwise (or for files git cannot move) use regular move.
+    Returns the list of sources that were moved.
     """
+    if not sources:
+        return []
+
+    used_git = False
     try:
-        # Try git mv first if we're in a git repo
+        # Try one batched git mv first; -k skips untracked files
         if is_git_repo():
-            result = subprocess.run(
-                ['git', 'mv', str(source), str(dest)],
+            subprocess.run(
+                ['git', 'mv', '-k', *[str(source) for source in sources], str(dest_dir)],
                 capture_output=True,
                 text=True,
-                timeout=10
+                timeout=30
             )
-            if result.returncode == 0:
-                return True
-            # If git mv fails, fall back to regular move
+            used_git = True
+    except (subprocess.TimeoutExpired, FileNotFoundError):
+        pass
 
-        # Fall back to regular file system move
-        move(str(source), str(dest))
-        return True
-    except Exception as e:
-        print(f"  ⚠️  Error moving {source}: {e}")
-        return False
+    moved = []
+    dest_dir_fd = open_dir_fd(dest_dir)
+    try:
+        for source in sources:
+            if used_git and not os.path.exists(source):
+                moved.append(source)
+                continue
+
+            try:
+                rename_into(source, dest_dir, dest_dir_fd)
+                moved.append(source)
+            except Exception as e:
+                print(f"  ⚠️  Error moving {source}: {e}")
+    finally:
+        if dest_dir_fd is not None:
+            os.close(dest_dir_fd)
+
+    return moved
+
+
+def archive_files(task_files, archive_dir):
+    """Move the given task file entries into archive_dir"""
+    moved = git_move_many([task_file.path for task_file in task_files], archive_dir)
+    for source in moved:
+        print(f"  Archived: {os.path.basename(source)}")
+    return len(moved)
 
 
 def extract_date_from_filename(filename):
@@ -63,15 +117,39 @@ def extract_date_from_filename(filename):
     return None
 
 
+SUCCESS_MARKER = '✅'.encode('utf-8')
+
+# Most task files fit in one read of this size
+HEAD_SIZE = 4096
+
+
 def has_success_outcome(filepath):
     """Check if task file has success outcome"""
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            return '✅' in f.read()
+        with open(filepath, 'rb') as f:
+            head = f.read(HEAD_SIZE)
+            if SUCCESS_MARKER in head:
+                return True
+            if len(head) < HEAD_SIZE:
+                return False
+            # Keep the end of the head so a marker split across reads still matches
+            overlap = head[-(len(SUCCESS_MARKER) - 1):]
+            return SUCCESS_MARKER in overlap + f.read()
     except Exception:
         return False
 
 
+def list_task_files(task_dir):
+    """Return DirEntry objects for the 202*.md task files in task_dir"""
+    with os.scandir(task_dir) as entries:
+        return [
+            entry for entry in entries
+            if entry.name.startswith("202")
+            and entry.name.endswith(".md")
+            and entry.is_file(follow_symlinks=False)
+        ]
+
+
 def archive_by_date_range(task_dir, archive_dir):
     """Archive tasks by date range"""
     start_date = input("Start date (YYYYMMDD): ").strip()
@@ -81,15 +159,13 @@ def archive_by_date_range(task_dir, archive_dir):
         print("Error: Invalid date format. Use YYYYMMDD")
         return
 
-    count = 0
-    for task_file in task_dir.glob("202*.md"):
+    task_files = []
+    for task_file in list_task_files(task_dir):
         file_date = extract_date_from_filename(task_file.name)
         if file_date and start_date <= file_date <= end_date:
-            if git_move(task_file, archive_dir / task_file.name):
-                print(f"  Archived: {task_file.name}")
-                count += 1
+            task_files.append(task_file)
 
-    return count
+    return archive_files(task_files, archive_dir)
 
 
 def archive_by_age(task_dir, archive_dir):
@@ -99,27 +175,23 @@ def archive_by_age(task_dir, archive_dir):
 
     cutoff_date = (datetime.now() - timedelta(days=days)).strftime("%Y%m%d")
 
-    count = 0
-    for task_file in task_dir.glob("202*.md"):
+    task_files = []
+    for task_file in list_task_files(task_dir):
         file_date = extract_date_from_filename(task_file.name)
         if file_date and file_date < cutoff_date:
-            if git_move(task_file, archive_dir / task_file.name):
-                print(f"  Archived: {task_file.name}")
-                count += 1
+            task_files.append(task_file)
 
-    return count
+    return archive_files(task_files, archive_dir)
 
 
 def archive_completed(task_dir, archive_dir):
     """Archive all completed tasks"""
-    count = 0
-    for task_file in task_dir.glob("202*.md"):
-        if has_success_outcome(task_file):
-            if git_move(task_file, archive_dir / task_file.name):
-                print(f"  Archived: {task_file.name}")
-                count += 1
-
-    return count
+    task_files = [
+        task_file for task_file in list_task_files(task_dir)
+        if has_success_outcome(task_file.path)
+    ]
+
+    return archive_files(task_files, archive_dir)
 
 
 def main():
@@ -9,30 +9,38 @@ Default count: 10
 import sys
 import os
 import re
+import heapq
+from operator import attrgetter
 from pathlib import Path
 
+DESCRIPTION_RE = re.compile(r'^\d{8}-\d{4}-(.*)\.md$')
+# Matched against raw bytes so task files are never decoded
+OUTCOME_RE = re.compile('^(⏳|✅|⚠️|❌)'.encode('utf-8'))
+
 
 def extract_datetime_from_filename(filename):
     """Extract and format datetime from task filename"""
-    match = re.match(r'^(\d{8})-(\d{4})', filename)
-    if not match:
+    # Fixed-position YYYYMMDD-HHMM prefix, so slice instead of matching
+    if not (
+        len(filename) >= 13
+        and filename[8] == '-'
+        and filename[:8].isdigit()
+        and filename[9:13].isdigit()
+    ):
         return "Unknown"
 
-    date_part = match.group(1)  # YYYYMMDD
-    time_part = match.group(2)  # HHMM
-
-    year = date_part[0:4]
-    month = date_part[4:6]
-    day = date_part[6:8]
-    hour = time_part[0:2]
-    minute = time_part[2:4]
+    year = filename[0:4]
+    month = filename[4:6]
+    day = filename[6:8]
+    hour = filename[9:11]
+    minute = filename[11:13]
 
     return f"{year}-{month}-{day} {hour}:{minute}"
 
 
 def extract_description(filename):
     """Extract description from task filename"""
-    match = re.match(r'^\d{8}-\d{4}-(.*)\.md$', filename)
+    match = DESCRIPTION_RE.match(filename)
     if match:
         return match.group(1).replace('-', ' ')
     return filename
@@ -41,16 +49,27 @@ def extract_description(filename):
 def extract_outcome(filepath):
     """Extract outcome emoji from task file"""
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
+        with open(filepath, 'rb') as f:
             for line in f:
-                match = re.match(r'^(⏳|✅|⚠️|❌)', line)
+                match = OUTCOME_RE.match(line)
                 if match:
-                    return match.group(1)
+                    return match.group(1).decode('utf-8')
     except Exception:
         pass
     return "  "
 
 
+def list_task_files(task_dir):
+    """Return DirEntry objects for the 202*.md task files in task_dir"""
+    with os.scandir(task_dir) as entries:
+        return [
+            entry for entry in entries
+            if entry.name.startswith("202")
+            and entry.name.endswith(".md")
+            and entry.is_file(follow_symlinks=False)
+        ]
+
+
 def main():
     count = 10
     if len(sys.argv) > 1:
@@ -69,18 +88,14 @@ def main():
     print(f"📋 Recent AI Tasks (last {count}):")
     print("")
 
-    # Find all task files, sort by date (newest first), limit to count
-    task_files = sorted(
-        task_dir.glob("202*.md"),
-        key=lambda x: x.name,
-        reverse=True
-    )[:count]
+    # Find all task files, keep the newest `count` (names sort by date)
+    task_files = heapq.nlargest(count, list_task_files(task_dir), key=attrgetter('name'))
 
     for task_file in task_files:
         filename = task_file.name
         formatted_date = extract_datetime_from_filename(filename)
         description = extract_description(filename)
-        outcome = extract_outcome(task_file)
+        outcome = extract_outcome(task_file.path)
 
         print(f"{outcome}  {formatted_date}  {description}")
 
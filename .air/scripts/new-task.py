@@ -8,18 +8,29 @@ Usage:
 
 import sys
 import os
-import re
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
 
 
+class _KebabTable(dict):
+    """str.translate table that deletes every character it does not map"""
+
+    def __missing__(self, key):
+        return None
+
+
+# Keep [a-z0-9-], turn spaces into dashes, drop everything else
+KEBAB_TABLE = _KebabTable({ord(c): c for c in 'abcdefghijklmnopqrstuvwxyz0123456789-'})
+KEBAB_TABLE[ord(' ')] = '-'
+
+
 def to_kebab_case(text: str) -> str:
     """Convert text to kebab-case"""
-    text = text.lower()
-    text = text.replace(' ', '-')
-    text = re.sub(r'[^a-z0-9-]', '', text)
-    return text
+    return text.lower().translate(KEBAB_TABLE)
+
+
+_tasks_dir_created = False
 
 
 def create_task(
@@ -37,9 +48,13 @@ def create_task(
 
     Returns:
         Path to created task file
+
+    Raises:
+        FileExistsError: If a task file with the same name already exists
     """
-    # Get current timestamp (UTC)
-    timestamp = datetime.now(timezone.utc).strftime("%Y%m%d-%H%M")
+    # Get current time (UTC) once for both filename and content
+    now = datetime.now(timezone.utc)
+    timestamp = f"{now:%Y%m%d-%H%M}"
 
     # Convert description to kebab-case
     kebab_description = to_kebab_case(description)
@@ -48,7 +63,7 @@ def create_task(
     filename = f".air/tasks/{timestamp}-{kebab_description}.md"
 
     # Get current date for file content
-    current_date = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M")
+    current_date = f"{now:%Y-%m-%d %H:%M}"
 
     # Create task content (no template needed)
     content = f"""# Task: {description}
@@ -74,12 +89,18 @@ def create_task(
 [Optional: Decisions, blockers, follow-up needed]
 """
 
-    # Ensure .air/tasks directory exists
-    Path(".air/tasks").mkdir(parents=True, exist_ok=True)
+    # Ensure .air/tasks directory exists (once per process)
+    global _tasks_dir_created
+    if not _tasks_dir_created:
+        Path(".air/tasks").mkdir(parents=True, exist_ok=True)
+        _tasks_dir_created = True
 
-    # Write task file
-    with open(filename, 'w') as f:
-        f.write(content)
+    # Write task file; O_EXCL refuses to clobber a same-minute task
+    fd = os.open(filename, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+    try:
+        os.write(fd, content.encode('utf-8'))
+    finally:
+        os.close(fd)
 
     if not silent:
         print(f"✅ Created task file: {filename}")
@@ -97,7 +118,11 @@ def main():
     description = sys.argv[1]
     prompt = sys.argv[2] if len(sys.argv) > 2 else None
 
-    filename = create_task(description, prompt)
+    try:
+        filename = create_task(description, prompt)
+    except FileExistsError as e:
+        print(f"Error: Task file already exists: {e.filename}")
+        sys.exit(1)
 
     print("")
     print("Task file ready for auto-documentation as work progresses.")
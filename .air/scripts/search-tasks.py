@@ -6,56 +6,97 @@ Usage: python search-tasks.py "keyword"
 """
 
 import sys
+import os
 import re
+import mmap
 from pathlib import Path
 
 
 def extract_datetime_from_filename(filename):
     """Extract and format datetime from task filename"""
-    match = re.match(r'^(\d{8})-(\d{4})', filename)
-    if not match:
+    # Fixed-position YYYYMMDD-HHMM prefix, so slice instead of matching
+    if not (
+        len(filename) >= 13
+        and filename[8] == '-'
+        and filename[:8].isdigit()
+        and filename[9:13].isdigit()
+    ):
         return "Unknown"
 
-    date_part = match.group(1)  # YYYYMMDD
-    time_part = match.group(2)  # HHMM
-
-    year = date_part[0:4]
-    month = date_part[4:6]
-    day = date_part[6:8]
-    hour = time_part[0:2]
-    minute = time_part[2:4]
+    year = filename[0:4]
+    month = filename[4:6]
+    day = filename[6:8]
+    hour = filename[9:11]
+    minute = filename[11:13]
 
     return f"{year}-{month}-{day} {hour}:{minute}"
 
 
-def search_file(filepath, search_term):
-    """Search file for term and return matching lines with context"""
+def _decode_line(data):
+    """Decode a raw line from a task file for display"""
+    return data.decode('utf-8', errors='replace').rstrip()
+
+
+def search_file(filepath, pattern):
+    """Search file for a compiled pattern and return matching lines with context"""
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-
-        matches = []
-        for i, line in enumerate(lines):
-            if search_term.lower() in line.lower():
-                # Get context: previous line, match, next line
-                context = []
-                if i > 0:
-                    context.append(lines[i - 1].rstrip())
-                context.append(f">>> {line.rstrip()}")
-                if i < len(lines) - 1:
-                    context.append(lines[i + 1].rstrip())
-
-                matches.append('\n'.join(context))
-
-                # Limit to first 10 matches
-                if len(matches) >= 10:
-                    break
-
-        return matches
-    except Exception as e:
+        fd = os.open(filepath, os.O_RDONLY)
+        try:
+            # mmap refuses zero-length files
+            if os.fstat(fd).st_size == 0:
+                return []
+            with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+                size = len(mm)
+                matches = []
+                last_line_start = -1
+
+                for match in pattern.finditer(mm):
+                    line_start = mm.rfind(b'\n', 0, match.start()) + 1
+                    # Report each line once, even with several hits on it
+                    if line_start == last_line_start:
+                        continue
+                    last_line_start = line_start
+
+                    line_end = mm.find(b'\n', match.end())
+                    if line_end == -1:
+                        line_end = size
+
+                    # Get context: previous line, match, next line
+                    context = []
+                    if line_start > 0:
+                        prev_start = mm.rfind(b'\n', 0, line_start - 1) + 1
+                        context.append(_decode_line(mm[prev_start:line_start - 1]))
+                    context.append(f">>> {_decode_line(mm[line_start:line_end])}")
+                    if line_end + 1 < size:
+                        next_end = mm.find(b'\n', line_end + 1)
+                        if next_end == -1:
+                            next_end = size
+                        context.append(_decode_line(mm[line_end + 1:next_end]))
+
+                    matches.append('\n'.join(context))
+
+                    # Limit to first 10 matches
+                    if len(matches) >= 10:
+                        break
+
+                return matches
+        finally:
+            os.close(fd)
+    except (OSError, ValueError):
         return []
 
 
+def list_task_files(task_dir):
+    """Return DirEntry objects for the 202*.md task files in task_dir"""
+    with os.scandir(task_dir) as entries:
+        return [
+            entry for entry in entries
+            if entry.name.startswith("202")
+            and entry.name.endswith(".md")
+            and entry.is_file(follow_symlinks=False)
+        ]
+
+
 def main():
     if len(sys.argv) < 2:
         print("Usage: python search-tasks.py \"search term\"")
@@ -72,21 +113,22 @@ def main():
     print(f"🔍 Searching for: \"{search_term}\"")
     print("")
 
+    # Compile the search term once; the scan runs over raw bytes
+    pattern = re.compile(re.escape(search_term.encode('utf-8')), re.IGNORECASE)
+
     # Search in task files, sorted by date (newest first)
     task_files = sorted(
-        task_dir.glob("202*.md"),
-        key=lambda x: x.name,
+        ((entry.name, entry.path) for entry in list_task_files(task_dir)),
         reverse=True
     )
 
     matches_found = 0
 
-    for task_file in task_files:
-        matches = search_file(task_file, search_term)
+    for filename, filepath in task_files:
+        matches = search_file(filepath, pattern)
 
         if matches:
             matches_found += 1
-            filename = task_file.name
             formatted_date = extract_datetime_from_filename(filename)
 
             print(f"📄 {filename} ({formatted_date})")
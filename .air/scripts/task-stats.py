@@ -6,72 +6,95 @@ Usage: python task-stats.py
 """
 
 import sys
+import os
 import re
 from pathlib import Path
 from datetime import datetime, timedelta
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from bisect import bisect_left
+
+
+# Outcome emojis in priority order, as UTF-8 bytes
+OUTCOME_MARKERS = (
+    (b'\xe2\x9c\x85', 'success'),                # ✅
+    (b'\xe2\x8f\xb3', 'in_progress'),            # ⏳
+    (b'\xe2\x9a\xa0\xef\xb8\x8f', 'partial'),     # ⚠️
+    (b'\xe2\x9d\x8c', 'blocked'),                # ❌
+)
+
+DESCRIPTION_RE = re.compile(r'^\d{8}-\d{4}-(.*)\.md$')
+
+# Task file reads are I/O bound, so threads overlap them well
+MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Most task files fit in one read of this size
+HEAD_SIZE = 4096
 
 
 def extract_outcome(filepath):
     """Extract outcome emoji from task file"""
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
-            if '✅' in content:
-                return 'success'
-            elif '⏳' in content:
-                return 'in_progress'
-            elif '⚠️' in content:
-                return 'partial'
-            elif '❌' in content:
-                return 'blocked'
-    except Exception:
-        pass
+        with open(filepath, 'rb') as f:
+            content = f.read(HEAD_SIZE)
+            # Success outranks every other marker, so finding it in the head settles it
+            if len(content) == HEAD_SIZE and OUTCOME_MARKERS[0][0] not in content:
+                content += f.read()
+    except OSError:
+        return None
+    for marker, outcome in OUTCOME_MARKERS:
+        if marker in content:
+            return outcome
     return None
 
 
 def extract_month_from_filename(filename):
     """Extract YYYYMM from filename"""
-    match = re.match(r'^(\d{6})', filename)
-    if match:
-        return match.group(1)
-    return None
-
-
-def extract_date_from_filename(filename):
-    """Extract YYYYMMDD from filename"""
-    match = re.match(r'^(\d{8})', filename)
-    if match:
-        return match.group(1)
+    month = filename[:6]
+    if len(month) == 6 and month.isdigit():
+        return month
     return None
 
 
 def extract_datetime_from_filename(filename):
     """Extract and format datetime from task filename"""
-    match = re.match(r'^(\d{8})-(\d{4})', filename)
-    if not match:
+    # Fixed-position YYYYMMDD-HHMM prefix, so slice instead of matching
+    if not (
+        len(filename) >= 13
+        and filename[8] == '-'
+        and filename[:8].isdigit()
+        and filename[9:13].isdigit()
+    ):
         return "Unknown"
 
-    date_part = match.group(1)  # YYYYMMDD
-    time_part = match.group(2)  # HHMM
-
-    year = date_part[0:4]
-    month = date_part[4:6]
-    day = date_part[6:8]
-    hour = time_part[0:2]
-    minute = time_part[2:4]
+    year = filename[0:4]
+    month = filename[4:6]
+    day = filename[6:8]
+    hour = filename[9:11]
+    minute = filename[11:13]
 
     return f"{year}-{month}-{day} {hour}:{minute}"
 
 
 def extract_description(filename):
     """Extract description from task filename"""
-    match = re.match(r'^\d{8}-\d{4}-(.*)\.md$', filename)
+    match = DESCRIPTION_RE.match(filename)
     if match:
         return match.group(1).replace('-', ' ')
     return filename
 
 
+def list_task_files(task_dir):
+    """Return DirEntry objects for the 202*.md task files in task_dir"""
+    with os.scandir(task_dir) as entries:
+        return [
+            entry for entry in entries
+            if entry.name.startswith("202")
+            and entry.name.endswith(".md")
+            and entry.is_file(follow_symlinks=False)
+        ]
+
+
 def main():
     task_dir = Path(".air/tasks")
 
@@ -83,22 +106,36 @@ def main():
     print("=" * 40)
     print("")
 
-    # Get all task files
-    task_files = list(task_dir.glob("202*.md"))
+    thirty_days_ago = (datetime.now() - timedelta(days=30)).strftime("%Y%m%d")
+
+    # Gather every statistic in a single pass over the task directory
+    outcomes = defaultdict(int)
+    months = defaultdict(int)
+
+    task_files = list_task_files(task_dir)
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        task_outcomes = list(executor.map(extract_outcome, [e.path for e in task_files]))
+
+    for entry, outcome in zip(task_files, task_outcomes):
+        if outcome:
+            outcomes[outcome] += 1
+
+        month = extract_month_from_filename(entry.name)
+        if month:
+            months[month] += 1
+
+    # Filenames sort by timestamp, so date-based stats are positions in the sorted list
+    names = sorted(entry.name for entry in task_files)
+    total_tasks = len(names)
+    most_recent = names[-1] if names else None
+    recent_count = total_tasks - bisect_left(names, thirty_days_ago)
 
     # Total tasks
-    total_tasks = len(task_files)
     print(f"Total Tasks: {total_tasks}")
     print("")
 
     # Tasks by outcome
     print("By Outcome:")
-    outcomes = defaultdict(int)
-    for task_file in task_files:
-        outcome = extract_outcome(task_file)
-        if outcome:
-            outcomes[outcome] += 1
-
     print(f"  ✅ Success:     {outcomes['success']}")
     print(f"  ⏳ In Progress: {outcomes['in_progress']}")
     print(f"  ⚠️  Partial:     {outcomes['partial']}")
@@ -107,12 +144,6 @@ def main():
 
     # Tasks by month
     print("By Month:")
-    months = defaultdict(int)
-    for task_file in task_files:
-        month = extract_month_from_filename(task_file.name)
-        if month:
-            months[month] += 1
-
     for month in sorted(months.keys()):
         year = month[0:4]
         mon = month[4:6]
@@ -122,24 +153,15 @@ def main():
 
     # Most recent task
     print("Most Recent Task:")
-    if task_files:
-        most_recent = sorted(task_files, key=lambda x: x.name, reverse=True)[0]
-        formatted_date = extract_datetime_from_filename(most_recent.name)
-        description = extract_description(most_recent.name)
+    if most_recent:
+        formatted_date = extract_datetime_from_filename(most_recent)
+        description = extract_description(most_recent)
         print(f"  {formatted_date} - {description}")
     else:
         print("  No tasks found")
     print("")
 
     # Activity last 30 days
-    thirty_days_ago = (datetime.now() - timedelta(days=30)).strftime("%Y%m%d")
-    recent_tasks = []
-    for task_file in task_files:
-        file_date = extract_date_from_filename(task_file.name)
-        if file_date and file_date >= thirty_days_ago:
-            recent_tasks.append(task_file)
-
-    recent_count = len(recent_tasks)
     avg_per_week = recent_count // 4
     print(f"Activity (last 30 days): {recent_count} tasks (~{avg_per_week} per week)")
     print("")
@@ -6,8 +6,11 @@ Usage: python validate-tasks.py
 """
 
 import sys
+import os
 import re
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter
 
 
 def validate_filename_format(filename):
@@ -16,63 +19,64 @@ def validate_filename_format(filename):
     return bool(re.match(pattern, filename))
 
 
-def validate_required_sections(filepath):
-    """Check if all required sections exist in file"""
-    required_sections = [
-        "# Task:",
-        "## Date",
-        "## Prompt",
-        "## Actions Taken",
-        "## Files Changed",
-        "## Outcome"
-    ]
-
-    missing_sections = []
+REQUIRED_SECTIONS = [
+    b"# Task:",
+    b"## Date",
+    b"## Prompt",
+    b"## Actions Taken",
+    b"## Files Changed",
+    b"## Outcome"
+]
 
-    try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
+# UTF-8 encodings of the outcome status emojis (⏳, ✅, ⚠, ❌)
+OUTCOME_EMOJIS = (b'\xe2\x8f\xb3', b'\xe2\x9c\x85', b'\xe2\x9a\xa0', b'\xe2\x9d\x8c')
 
-        for section in required_sections:
-            if section not in content:
-                missing_sections.append(section)
+# Task file reads are I/O bound, so threads overlap them well
+MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
 
-    except Exception as e:
-        return [f"Error reading file: {e}"]
+PROMPT_SECTION_RE = re.compile(rb'(?ms)^## Prompt[^\n]*\n(.*?)(?=^##|\Z)')
 
-    return missing_sections
 
+def inspect_task(filepath):
+    """
+    Read a task file once and run all content checks on it.
 
-def check_prompt_placeholder(filepath):
-    """Check if prompt section has placeholder text"""
+    Returns (missing_sections, has_prompt_placeholder, has_outcome_status).
+    """
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
+        with open(filepath, 'rb') as f:
+            data = f.read()
+    except OSError as e:
+        return [f"Error reading file: {e}"], False, False
+
+    # Check if all required sections exist in file
+    missing_sections = [
+        section.decode() for section in REQUIRED_SECTIONS if section not in data
+    ]
 
-        in_prompt_section = False
-        for line in lines:
-            if "## Prompt" in line:
-                in_prompt_section = True
-                continue
-            if in_prompt_section and line.startswith("##"):
-                break
-            if in_prompt_section and line.strip().startswith('['):
-                return True
+    # Check if prompt section has placeholder text
+    has_placeholder = False
+    match = PROMPT_SECTION_RE.search(data)
+    if match:
+        has_placeholder = any(
+            line.strip().startswith(b'[') for line in match.group(1).splitlines()
+        )
 
-    except Exception:
-        pass
+    # Check if outcome status emoji exists
+    has_outcome = any(emoji in data for emoji in OUTCOME_EMOJIS)
 
-    return False
+    return missing_sections, has_placeholder, has_outcome
 
 
-def check_outcome_status(filepath):
-    """Check if outcome status emoji exists"""
-    try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
-            return any(emoji in content for emoji in ['⏳', '✅', '⚠️', '❌'])
-    except Exception:
-        return False
+def list_task_files(task_dir):
+    """Return DirEntry objects for the 202*.md task files in task_dir"""
+    with os.scandir(task_dir) as entries:
+        return [
+            entry for entry in entries
+            if entry.name.startswith("202")
+            and entry.name.endswith(".md")
+            and entry.is_file(follow_symlinks=False)
+        ]
 
 
 def main():
@@ -88,9 +92,11 @@ def main():
     print("=" * 50)
     print("")
 
-    task_files = sorted(task_dir.glob("202*.md"))
+    task_files = sorted(list_task_files(task_dir), key=attrgetter('name'))
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        inspections = list(executor.map(inspect_task, [f.path for f in task_files]))
 
-    for task_file in task_files:
+    for task_file, inspection in zip(task_files, inspections):
         filename = task_file.name
         file_errors = 0
         file_warnings = 0
@@ -100,19 +106,20 @@ def main():
             print(f"❌ {filename}: Invalid filename format")
             file_errors += 1
 
+        missing, has_placeholder, has_outcome = inspection
+
         # Check required sections
-        missing = validate_required_sections(task_file)
         for section in missing:
             print(f"⚠️  {filename}: Missing section: {section}")
             file_warnings += 1
 
         # Check prompt placeholder
-        if check_prompt_placeholder(task_file):
+        if has_placeholder:
             print(f"⚠️  {filename}: Prompt section appears to be placeholder text")
             file_warnings += 1
 
         # Check outcome status
-        if not check_outcome_status(task_file):
+        if not has_outcome:
             print(f"⚠️  {filename}: No outcome status emoji found")
             file_warnings += 1
 
@@ -1,33 +1,68 @@
 """Main CLI entry point for AIR toolkit."""
 
+import importlib
+from typing import Any
+
 import click
-from rich.console import Console
 
 from air import __version__
-from air.commands import (
-    init,
-    link,
-    validate,
-    status,
-    classify,
-    pr,
-    review,
-    claude,
-    task,
-    track,
-    summary,
-    analyze,
-    cache,
-    findings,
-    wait,
-    upgrade,
-    completion,
-)
-
-console = Console()
-
-
-@click.group()
+
+
+class LazyGroup(click.Group):
+    """Click group that imports subcommand modules on first use.
+
+    Subcommands are declared as ``name -> "module.path:attribute"`` so that
+    running one command does not pay the import cost of all the others.
+    """
+
+    def __init__(
+        self, *args: Any, lazy_subcommands: dict[str, str] | None = None, **kwargs: Any
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted({*super().list_commands(ctx), *self.lazy_subcommands})
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        if cmd_name in self.lazy_subcommands:
+            return self._load_command(cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def _load_command(self, cmd_name: str) -> click.Command:
+        module_path, attr = self.lazy_subcommands[cmd_name].split(":")
+        command = getattr(importlib.import_module(module_path), attr)
+        if not isinstance(command, click.Command):
+            raise TypeError(f"Lazy subcommand {cmd_name!r} is not a click command: {command!r}")
+        return command
+
+
+LAZY_SUBCOMMANDS = {
+    # Assessment commands
+    "init": "air.commands.init:init",
+    "link": "air.commands.link:link",
+    "validate": "air.commands.validate:validate",
+    "status": "air.commands.status:status",
+    "classify": "air.commands.classify:classify",
+    "pr": "air.commands.pr:pr",
+    "review": "air.commands.review:review",
+    "analyze": "air.commands.analyze:analyze",
+    "cache": "air.commands.cache:cache",
+    "findings": "air.commands.findings:findings",
+    "wait": "air.commands.wait:wait",
+    "upgrade": "air.commands.upgrade:upgrade",
+    # AI assistant commands
+    "claude": "air.commands.claude:claude",
+    # Task tracking commands
+    "task": "air.commands.task:task",
+    "track": "air.commands.track:track",
+    "summary": "air.commands.summary:summary",
+    # Shell completion
+    "completion": "air.commands.completion:completion",
+}
+
+
+@click.group(cls=LazyGroup, lazy_subcommands=LAZY_SUBCOMMANDS)
 @click.version_option(version=__version__, prog_name="air")
 @click.pass_context
 def main(ctx: click.Context) -> None:
@@ -51,31 +86,5 @@ def main(ctx: click.Context) -> None:
     ctx.ensure_object(dict)
 
 
-# Assessment commands
-main.add_command(init.init)
-main.add_command(link.link)
-main.add_command(validate.validate)
-main.add_command(status.status)
-main.add_command(classify.classify)
-main.add_command(pr.pr)
-main.add_command(review.review)
-main.add_command(analyze.analyze)
-main.add_command(cache.cache)
-main.add_command(findings.findings)
-main.add_command(wait.wait)
-main.add_command(upgrade.upgrade)
-
-# AI assistant commands
-main.add_command(claude.claude)
-
-# Task tracking commands
-main.add_command(task.task)
-main.add_command(track.track)
-main.add_command(summary.summary)
-
-# Shell completion
-main.add_command(completion.completion)
-
-
 if __name__ == "__main__":
     main()
@@ -1,25 +1,11 @@
-"""Command modules for AIR CLI."""
+"""Command modules for AIR CLI.
 
-# Import all command modules for easy access
-from . import (
-    init,
-    link,
-    validate,
-    status,
-    classify,
-    pr,
-    task,
-    track,
-    summary,
-    review,
-    claude,
-    analyze,
-    cache,
-    findings,
-    wait,
-    upgrade,
-    completion,
-)
+Modules are imported on first attribute access so that loading one command
+does not import every other command module.
+"""
+
+import importlib
+from types import ModuleType
 
 __all__ = [
     "init",
@@ -40,3 +26,9 @@ __all__ = [
     "upgrade",
     "completion",
 ]
+
+
+def __getattr__(name: str) -> ModuleType:
+    if name in __all__:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,10 +1,13 @@
 """Analyze repositories using AI agents."""
 
-import json
+import os
 import sys
 import time
 import traceback
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from graphlib import CycleError, TopologicalSorter
 from pathlib import Path
+from typing import Any
 
 import click
 
@@ -12,28 +15,34 @@ from air.core.models import AirConfig
 from air.services.agent_manager import (
     AnalysisOrchestrator,
     generate_agent_id,
-    reconstruct_analyzer_result,
     spawn_background_agent,
     update_agent_status,
 )
-from air.services.analyzers import (
-    ArchitectureAnalyzer,
-    CodeStructureAnalyzer,
-    PerformanceAnalyzer,
-    QualityAnalyzer,
-    SecurityAnalyzer,
-)
-from air.services.cache_manager import CacheManager
-from air.services.classifier import classify_resource
+from air.services.analyzers import Finding, build_file_index, get_analyzer_class
+from air.services.cache_manager import CacheManager, get_repo_marker
+from air.services.classifier import classification_to_dict, classify_resource_cached
 from air.services.dependency_graph import (
+    break_dependency_cycles,
     build_dependency_graph,
     detect_dependency_gaps,
     filter_repos_with_dependencies,
-    topological_sort,
 )
 from air.services.filesystem import get_project_root, load_config
 from air.utils.completion import complete_analyzer_focus, complete_resource_names
-from air.utils.console import error, info, success, warn
+from air.utils.console import console, error, info, success, warn
+from air.utils.jsonio import read_json, write_json
+
+# Analyzers to run for each focus area (None = no focus, run all)
+_FOCUS_ANALYZERS: dict[str | None, tuple[str, ...]] = {
+    "security": ("security",),
+    "performance": ("performance",),
+    "architecture": ("architecture",),
+    "quality": ("quality",),
+    None: ("security", "performance", "architecture", "quality", "code_structure"),
+}
+
+# Bucket index for each severity when counting findings
+_SEVERITY_INDEX: dict[str, int] = {"critical": 0, "high": 1, "medium": 2, "low": 3, "info": 4}
 
 
 @click.command()
@@ -50,7 +59,9 @@ from air.utils.console import error, info, success, warn
 @click.option("--clear-cache", is_flag=True, help="Clear cache before analysis")
 @click.option("--include-external", is_flag=True, help="Include external/vendor libraries in analysis")
 @click.option("--parallel", is_flag=True, help="Run analyzers in parallel (faster)")
-@click.option("--workers", type=int, default=None, help="Number of parallel workers (default: CPU count)")
+@click.option("--workers", type=int, default=None, help="Number of parallel workers (default: sized to the analyzer tasks)")
+@click.option("--timings", is_flag=True, help="Show timing breakdown")
+@click.option("--compress", is_flag=True, help="Write findings as gzip-compressed JSON (.json.gz)")
 def analyze(
     resource: str | None,
     analyze_all: bool,
@@ -66,6 +77,8 @@ def analyze(
     include_external: bool,
     parallel: bool,
     workers: int | None,
+    timings: bool,
+    compress: bool,
 ) -> None:
     """Analyze repositories with intelligent defaults.
 
@@ -141,11 +154,21 @@ def analyze(
             include_external=include_external,
             parallel=parallel,
             max_workers=workers,
+            timings=timings,
+            compress=compress,
         )
         return
 
     if gap:
-        _analyze_gap(config=config, library_name=gap, focus=focus, include_external=include_external)
+        _analyze_gap(
+            config=config,
+            library_name=gap,
+            focus=focus,
+            include_external=include_external,
+            cache_manager=cache_manager,
+            no_cache=no_cache,
+            compress=compress,
+        )
         return
 
     # Single repo analysis - resolve resource name or path
@@ -171,9 +194,26 @@ def analyze(
         include_external=include_external,
         parallel=parallel,
         max_workers=workers,
+        timings=timings,
+        compress=compress,
     )
 
 
+def _absolute_path(path: str | Path) -> Path:
+    """Expand and absolutize a path without resolving symlinks.
+
+    os.path.abspath is purely lexical, unlike Path.resolve() which issues a
+    readlink per path component.
+
+    Args:
+        path: Path to expand
+
+    Returns:
+        Absolute path
+    """
+    return Path(os.path.abspath(os.path.expanduser(path)))
+
+
 def _resolve_resource(config: AirConfig, resource: str) -> Path:
     """Resolve resource name or path to absolute path.
 
@@ -188,40 +228,43 @@ def _resolve_resource(config: AirConfig, resource: str) -> Path:
         SystemExit: If resource not found
     """
     # Try as resource name first
-    for r in config.get_all_resources():
-        if r.name == resource:
-            return Path(r.path).expanduser().resolve()
+    named_resource = config.find_resource(resource)
+    if named_resource:
+        return named_resource.absolute_path
 
     # Try as path
     path = Path(resource).expanduser()
     if path.exists():
-        return path.resolve()
+        return _absolute_path(path)
 
     error(f"Resource not found: {resource}", exit_code=1)
 
 
-def _get_analyzer_list(focus: str | None) -> list[str]:
-    """Get list of analyzer names based on focus.
+def _get_analyzer_list(focus: str | None) -> tuple[str, ...]:
+    """Get analyzer names based on focus.
 
     Args:
         focus: Analysis focus area or None for all
 
     Returns:
-        List of analyzer names
+        Tuple of analyzer names (empty for an unknown focus)
     """
-    if focus == "security":
-        return ["security"]
-    elif focus == "performance":
-        return ["performance"]
-    elif focus == "architecture":
-        return ["architecture"]
-    elif focus == "quality":
-        return ["quality"]
-    elif not focus:
-        # All analyzers
-        return ["security", "performance", "architecture", "quality", "code_structure"]
-    else:
-        return []
+    return _FOCUS_ANALYZERS.get(focus or None, ())
+
+
+def _recommended_workers(total_tasks: int) -> int:
+    """Get a worker count for running analyzer tasks in parallel.
+
+    Analyzers spend much of their time waiting on file I/O, so the pool may
+    oversubscribe the CPUs, but never beyond one worker per task.
+
+    Args:
+        total_tasks: Number of analyzer tasks to run
+
+    Returns:
+        Recommended number of workers
+    """
+    return max(1, min(total_tasks, (os.cpu_count() or 1) * 8))
 
 
 def _analyze_single_repo(
@@ -239,6 +282,12 @@ def _analyze_single_repo(
     include_external: bool = False,
     parallel: bool = False,
     max_workers: int | None = None,
+    show_progress: bool = True,
+    graph: dict[str, set[str]] | None = None,
+    timings: bool = False,
+    parallel_results: list[dict[str, Any]] | None = None,
+    dependency_cycles: list[dict] | None = None,
+    compress: bool = False,
 ) -> None:
     """Analyze a single repository.
 
@@ -254,6 +303,13 @@ def _analyze_single_repo(
         no_cache: Skip cache lookup/storage
         current_index: Current repo index (for progress display)
         total_count: Total repos to analyze (for progress display)
+        show_progress: Show live progress bars for parallel analyzers
+        graph: Prebuilt dependency graph (built from config if not given)
+        timings: Collect and show timing breakdown
+        parallel_results: Analyzer results already produced by a shared
+            orchestrator (parallel mode only)
+        dependency_cycles: Cycles broken at this repo to order the analysis
+        compress: Write findings as gzip-compressed JSON
     """
     if background:
         # Spawn background agent
@@ -263,7 +319,7 @@ def _analyze_single_repo(
         spawn_background_agent(
             agent_id=agent_id,
             command="analyze",
-            args={"focus": focus} if focus else {},
+            args={"focus": focus, "compress": compress},
             resource_path=str(resource_path),
         )
         return
@@ -271,7 +327,7 @@ def _analyze_single_repo(
     # Run analysis
     try:
         # Start timing
-        analysis_start = time.time()
+        analysis_start = time.perf_counter_ns()
 
         # Show progress indicator if we have index/count
         if current_index is not None and total_count is not None:
@@ -288,9 +344,9 @@ def _analyze_single_repo(
             info(f"Focus area: {focus}")
 
         # Always start with classification
-        classification_start = time.time()
-        result = classify_resource(resource_path)
-        classification_time = time.time() - classification_start
+        classification_start = time.perf_counter_ns()
+        result = classify_resource_cached(resource_path, None if no_cache else cache_manager)
+        classification_time = time.perf_counter_ns() - classification_start
 
         info(f"  Type: {result.resource_type.value}")
         if result.technology_stack:
@@ -302,17 +358,12 @@ def _analyze_single_repo(
         info(f"  Confidence: {result.confidence:.0%}")
 
         # Store classification as metadata (not a finding)
-        classification_metadata = {
-            "type": result.resource_type.value,
-            "technology_stack": result.technology_stack,
-            "confidence": result.confidence,
-            "languages": result.detected_languages,
-            "frameworks": result.detected_frameworks,
-            "reasoning": result.reasoning,
-        }
+        classification_metadata = classification_to_dict(result)
 
-        # Initialize findings list (no classification entry)
-        all_findings = []
+        # Initialize findings list (no classification entry); severities are
+        # counted as findings are added so the summary needs no second pass
+        all_findings: list[dict[str, Any]] = []
+        severity_counts = [0] * len(_SEVERITY_INDEX)
 
         # Run deep analysis based on focus
         analyzer_times = {}
@@ -321,124 +372,114 @@ def _analyze_single_repo(
             # PARALLEL EXECUTION using subprocess orchestrator
             analyzer_names = _get_analyzer_list(focus)
 
-            with AnalysisOrchestrator(max_workers=max_workers) as orchestrator:
-                results = orchestrator.analyze_parallel(
-                    repo_paths=[resource_path],
-                    analyzers=analyzer_names,
-                    include_external=include_external,
-                )
+            if parallel_results is None:
+                workers = max_workers or _recommended_workers(len(analyzer_names))
+                with AnalysisOrchestrator(max_workers=workers) as orchestrator:
+                    results = orchestrator.analyze_parallel(
+                        repo_paths=[resource_path],
+                        analyzers=analyzer_names,
+                        include_external=include_external,
+                        show_progress=show_progress,
+                    )
+                parallel_results = results.get(str(resource_path), [])
 
             # Process results from parallel execution
-            for result_dict in results.get(str(resource_path), []):
+            for result_dict in parallel_results:
                 if result_dict.get("success"):
-                    # Extract timing
-                    analyzer_name = result_dict.get("analyzer")
-                    analyzer_times[analyzer_name] = result_dict.get("elapsed_time", 0)
-
-                    # Reconstruct result and add findings
-                    analyzer_result = reconstruct_analyzer_result(result_dict)
-                    if analyzer_result:
-                        # Add summary
-                        all_findings.append({
-                            "category": analyzer_result.analyzer_name,
-                            "severity": "info",
-                            "type": "summary",
-                            "summary": analyzer_result.summary,
-                        })
-
-                        # Add individual findings
-                        for finding in analyzer_result.findings:
-                            all_findings.append(finding.to_dict())
+                    # Findings arrive already serialized; use them as-is
+                    result_data = result_dict.get("result", {})
+                    _add_analyzer_findings(
+                        all_findings,
+                        severity_counts,
+                        result_data.get("analyzer", result_dict["analyzer"]),
+                        result_data.get("summary", {}),
+                        result_data.get("findings", []),
+                    )
 
         else:
-            # SEQUENTIAL EXECUTION (original code path)
-            analyzers = []
-
-            if focus == "security" or not focus:
-                analyzers.append(SecurityAnalyzer(resource_path, include_external=include_external))
-
-            if focus == "performance" or not focus:
-                analyzers.append(PerformanceAnalyzer(resource_path, include_external=include_external))
-
-            if focus == "architecture" or not focus:
-                analyzers.append(ArchitectureAnalyzer(resource_path, include_external=include_external))
-
-            if focus == "quality" or not focus:
-                analyzers.append(QualityAnalyzer(resource_path, include_external=include_external))
-
-            if not focus:  # Always run structure analysis when no focus
-                analyzers.append(CodeStructureAnalyzer(resource_path, include_external=include_external))
-
-            # Run analyzers and collect findings
-            for analyzer in analyzers:
-                analyzer_result = None
-                analyzer_start = time.time()
-
-                # Check cache first (unless --no-cache or no cache_manager)
-                if not no_cache and cache_manager:
-                    # Create a marker file representing the whole repo
-                    # (We cache at repo level, not file level for now)
-                    repo_marker = resource_path / ".git" if (resource_path / ".git").exists() else resource_path
-                    cached_result = cache_manager.get_cached_analysis(
-                        resource_path, repo_marker, analyzer.name
-                    )
+            # IN-PROCESS EXECUTION: uncached analyzers run on a thread pool
+            analyzer_names = _get_analyzer_list(focus)
 
-                    if cached_result:
-                        info(f"  {analyzer.name} analysis (cached)...")
-                        analyzer_result = cached_result
-
-                # Run analysis if not cached
-                if not analyzer_result:
-                    info(f"  Running {analyzer.name} analysis...")
-                    analyzer_result = analyzer.analyze()
-
-                    # Cache the result (unless --no-cache or no cache_manager)
-                    if not no_cache and cache_manager:
-                        repo_marker = resource_path / ".git" if (resource_path / ".git").exists() else resource_path
-                        cache_manager.set_cached_analysis(resource_path, repo_marker, analyzer_result)
-
-                analyzer_times[analyzer.name] = time.time() - analyzer_start
-
-                # Add summary to findings
-                all_findings.append(
-                    {
-                        "category": analyzer.name,
-                        "severity": "info",
-                        "type": "summary",
-                        "summary": analyzer_result.summary,
-                    }
+            # Use a marker representing the whole repo
+            # (We cache at repo level, not file level for now)
+            repo_marker = get_repo_marker(resource_path)
+
+            # Check cache first (unless --no-cache or no cache_manager)
+            cached_results = {}
+            if not no_cache and cache_manager:
+                cached_results = cache_manager.get_cached_analyses(
+                    resource_path,
+                    repo_marker,
+                    list(analyzer_names),
                 )
 
-                # Add individual findings
-                for finding in analyzer_result.findings:
-                    all_findings.append(finding.to_dict())
+            # Start every uncached analyzer; the shared file index is read-only
+            pending = [name for name in analyzer_names if not cached_results.get(name)]
+            futures: dict[str, Future] = {}
+            executor = None
+            if pending:
+                # Walk the repo once (only when something has to run) and
+                # share the file list between analyzers; only the pending
+                # analyzers' modules are imported
+                file_index = build_file_index(resource_path, include_external)
+                executor = ThreadPoolExecutor(
+                    max_workers=max_workers or min(len(pending), os.cpu_count() or 1)
+                )
+                for analyzer_name in pending:
+                    analyzer = get_analyzer_class(analyzer_name)(
+                        resource_path, include_external=include_external, file_index=file_index
+                    )
+                    info(f"  Running {analyzer_name} analysis...")
+                    futures[analyzer_name] = executor.submit(_run_analyzer, analyzer)
 
-                # Show summary
-                if analyzer_result.summary:
-                    summary_items = [f"{k}: {v}" for k, v in analyzer_result.summary.items()]
-                    info(f"  {analyzer.name}: {', '.join(summary_items[:3])}")
+            # Collect results in analyzer order so output stays deterministic
+            try:
+                for analyzer_name in analyzer_names:
+                    analyzer_result = cached_results.get(analyzer_name)
+                    if analyzer_result:
+                        info(f"  {analyzer_name} analysis (cached)...")
+                        elapsed_ns = 0
+                    else:
+                        analyzer_result, elapsed_ns = futures[analyzer_name].result()
+
+                        # Cache the result (unless --no-cache or no cache_manager)
+                        if not no_cache and cache_manager:
+                            cache_manager.set_cached_analysis(resource_path, repo_marker, analyzer_result)
+
+                    if timings:
+                        analyzer_times[analyzer_name] = elapsed_ns
+
+                    _add_analyzer_findings(
+                        all_findings,
+                        severity_counts,
+                        analyzer_name,
+                        analyzer_result.summary,
+                        list(map(Finding.to_dict, analyzer_result.findings)),
+                    )
 
-        # Count findings by severity (exclude summary entries)
-        severity_counts = {}
-        actual_findings = [f for f in all_findings if f.get("type") != "summary"]
-        for finding in actual_findings:
-            sev = finding.get("severity", "info")
-            severity_counts[sev] = severity_counts.get(sev, 0) + 1
+                    # Show summary
+                    if analyzer_result.summary:
+                        summary_items = [f"{k}: {v}" for k, v in analyzer_result.summary.items()]
+                        info(f"  {analyzer_name}: {', '.join(summary_items[:3])}")
+            finally:
+                if executor:
+                    executor.shutdown(cancel_futures=True)
 
         info(
-            f"Total findings: {len(actual_findings)} "
-            f"(critical: {severity_counts.get('critical', 0)}, "
-            f"high: {severity_counts.get('high', 0)}, "
-            f"medium: {severity_counts.get('medium', 0)})"
+            f"Total findings: {sum(severity_counts)} "
+            f"(critical: {severity_counts[_SEVERITY_INDEX['critical']]}, "
+            f"high: {severity_counts[_SEVERITY_INDEX['high']]}, "
+            f"medium: {severity_counts[_SEVERITY_INDEX['medium']]})"
         )
 
         # Check for dependency issues if requested
         deps_time = 0
         if check_deps and config:
-            deps_start = time.time()
+            deps_start = time.perf_counter_ns()
             info("Checking dependencies...")
-            info("  Building dependency graph from imports and package files...")
-            graph = build_dependency_graph(config)
+            if graph is None:
+                info("  Building dependency graph from imports and package files...")
+                graph = build_dependency_graph(config)
             info(f"  Found {len(graph)} dependencies to analyze")
             info("  Detecting dependency gaps and issues...")
             gaps = detect_dependency_gaps(config, graph)
@@ -447,33 +488,39 @@ def _analyze_single_repo(
                 all_findings.extend(gaps)
             else:
                 info("  No dependency issues found")
-            deps_time = time.time() - deps_start
+            deps_time = time.perf_counter_ns() - deps_start
+
+        # Record dependency edges ignored to break cycles
+        if dependency_cycles:
+            all_findings.extend(dependency_cycles)
 
         # Save findings to analysis directory with classification metadata
         analysis_dir = project_root / "analysis" / "reviews"
         analysis_dir.mkdir(parents=True, exist_ok=True)
 
-        findings_file = analysis_dir / f"{resource_path.name}-findings.json"
+        findings_file = _findings_path(analysis_dir, resource_path.name, compress)
         analysis_report = {
             "repository": resource_path.name,
             "classification": classification_metadata,
             "findings": all_findings,
         }
-        findings_file.write_text(json.dumps(analysis_report, indent=2))
+        write_json(findings_file, analysis_report)
+        # Drop the other format so readers never pick up a stale report
+        _findings_path(analysis_dir, resource_path.name, not compress).unlink(missing_ok=True)
 
         # Calculate total time
-        total_time = time.time() - analysis_start
+        total_time = time.perf_counter_ns() - analysis_start
 
         # Display timing information (skip if parallel - already shown in progress)
-        if not parallel:
+        if timings and not parallel:
             info("")
             info("⏱️  Analysis Timing:")
-            info(f"  Classification: {classification_time:.2f}s")
+            info(f"  Classification: {classification_time / 1e9:.2f}s")
             for analyzer_name, analyzer_time in analyzer_times.items():
-                info(f"  {analyzer_name}: {analyzer_time:.2f}s")
+                info(f"  {analyzer_name}: {analyzer_time / 1e9:.2f}s")
             if deps_time > 0:
-                info(f"  Dependencies: {deps_time:.2f}s")
-            info(f"  Total: {total_time:.2f}s")
+                info(f"  Dependencies: {deps_time / 1e9:.2f}s")
+            info(f"  Total: {total_time / 1e9:.2f}s")
             info("")
 
         success(f"Analysis complete: {findings_file}")
@@ -493,6 +540,169 @@ def _analyze_single_repo(
         sys.exit(1)
 
 
+def _run_analyzer(analyzer: Any) -> tuple[Any, int]:
+    """Run a single analyzer, timing it.
+
+    Args:
+        analyzer: Analyzer instance to run
+
+    Returns:
+        Tuple of (analyzer result, elapsed nanoseconds)
+    """
+    start = time.perf_counter_ns()
+    result = analyzer.analyze()
+    return result, time.perf_counter_ns() - start
+
+
+def _add_analyzer_findings(
+    all_findings: list[dict[str, Any]],
+    severity_counts: list[int],
+    analyzer_name: str,
+    summary: dict[str, Any],
+    findings: list[dict[str, Any]],
+) -> None:
+    """Append an analyzer's summary and findings, counting severities.
+
+    Args:
+        all_findings: Findings list to extend
+        severity_counts: Per-severity counts of findings, indexed by
+            _SEVERITY_INDEX (summaries excluded)
+        analyzer_name: Name of the analyzer
+        summary: Analyzer summary
+        findings: Serialized findings produced by the analyzer
+    """
+    # Add summary to findings
+    all_findings.append(
+        {
+            "category": analyzer_name,
+            "severity": "info",
+            "type": "summary",
+            "summary": summary,
+        }
+    )
+
+    # Add individual findings
+    all_findings.extend(findings)
+    # Bucket by a fixed index; unknown severities count as info
+    severity_index = _SEVERITY_INDEX.get
+    info_index = _SEVERITY_INDEX["info"]
+    for finding in findings:
+        severity_counts[severity_index(finding.get("severity", "info"), info_index)] += 1
+
+
+def _findings_path(analysis_dir: Path, repo_name: str, compress: bool) -> Path:
+    """Get the findings report path for a repo.
+
+    Args:
+        analysis_dir: Directory holding findings reports
+        repo_name: Repository name
+        compress: Whether the report is gzip-compressed
+
+    Returns:
+        Path to <repo>-findings.json, or <repo>-findings.json.gz if compressed
+    """
+    suffix = ".json.gz" if compress else ".json"
+    return analysis_dir / f"{repo_name}-findings{suffix}"
+
+
+def _load_current_findings(
+    project_root: Path,
+    resource_path: Path,
+    focus: str | None,
+    cache_manager: CacheManager | None,
+    no_cache: bool,
+) -> dict[str, Any] | None:
+    """Load a repo's findings report if it can be reused without re-analysis.
+
+    Args:
+        project_root: AIR project root
+        resource_path: Path to repository
+        focus: Analysis focus area
+        cache_manager: Cache manager instance
+        no_cache: Skip cache lookup
+
+    Returns:
+        The findings report if every analyzer for the focus is cached and the
+        report was produced by the same set of analyzers, otherwise None
+    """
+    if no_cache or not cache_manager:
+        return None
+
+    analyzer_names = list(_get_analyzer_list(focus))
+    if not cache_manager.is_fully_cached(resource_path, get_repo_marker(resource_path), analyzer_names):
+        return None
+
+    analysis_dir = project_root / "analysis" / "reviews"
+    for compress in (False, True):
+        try:
+            report = read_json(_findings_path(analysis_dir, resource_path.name, compress))
+            break
+        except (OSError, ValueError):
+            continue
+    else:
+        return None
+
+    analyzed = {
+        finding.get("category")
+        for finding in report.get("findings", [])
+        if finding.get("type") == "summary"
+    }
+    return report if analyzed == set(analyzer_names) else None
+
+
+def _refresh_gap_findings(
+    project_root: Path,
+    resource_path: Path,
+    report: dict[str, Any],
+    gaps: list[dict[str, Any]],
+    compress: bool,
+) -> None:
+    """Replace the dependency gap findings in a reused findings report.
+
+    Gap findings depend on the current versions of other repos, so they go
+    stale even when the repo itself (and its cached analysis) has not changed.
+
+    Args:
+        project_root: AIR project root
+        resource_path: Path to repository
+        report: Findings report loaded by _load_current_findings
+        gaps: Current dependency gap findings
+        compress: Write findings as gzip-compressed JSON
+    """
+    findings = [
+        finding for finding in report.get("findings", [])
+        if finding.get("type") != "version_mismatch"
+    ]
+    # Keep the analysis order: analyzer findings, gaps, then broken cycles
+    cycles = [finding for finding in findings if finding.get("type") == "dependency_cycle"]
+    findings = [finding for finding in findings if finding.get("type") != "dependency_cycle"]
+    report["findings"] = [*findings, *gaps, *cycles]
+
+    analysis_dir = project_root / "analysis" / "reviews"
+    write_json(_findings_path(analysis_dir, resource_path.name, compress), report)
+    _findings_path(analysis_dir, resource_path.name, not compress).unlink(missing_ok=True)
+
+
+def _analyze_repo_worker(**kwargs: Any) -> tuple[str, int]:
+    """Run _analyze_single_repo in a pool process and capture its output.
+
+    Args:
+        **kwargs: Arguments for _analyze_single_repo
+
+    Returns:
+        Tuple of (rendered console output, exit code)
+    """
+    exit_code = 0
+    console.begin_capture()
+    try:
+        _analyze_single_repo(**kwargs)
+    except SystemExit as e:
+        exit_code = e.code if isinstance(e.code, int) else 1
+    finally:
+        output = console.end_capture()
+    return output, exit_code
+
+
 def _analyze_multi_repo(
     config: AirConfig,
     respect_deps: bool,
@@ -504,6 +714,8 @@ def _analyze_multi_repo(
     include_external: bool = False,
     parallel: bool = False,
     max_workers: int | None = None,
+    timings: bool = False,
+    compress: bool = False,
 ) -> None:
     """Analyze multiple repos with dependency awareness.
 
@@ -515,12 +727,14 @@ def _analyze_multi_repo(
         background: Run analyses in background
         cache_manager: Cache manager instance
         no_cache: Skip cache lookup/storage
+        timings: Show timing breakdown
+        compress: Write findings as gzip-compressed JSON
     """
     # Start total timing
-    multi_repo_start = time.time()
+    multi_repo_start = time.perf_counter_ns()
 
     # Build dependency graph with progress
-    graph_start = time.time()
+    graph_start = time.perf_counter_ns()
 
     from rich.console import Console
     from rich.spinner import Spinner
@@ -536,8 +750,8 @@ def _analyze_multi_repo(
     for repo_name in graph.keys():
         info(f"  [magenta]{repo_name}[/magenta]")
 
-    graph_time = time.time() - graph_start
-    info(f"Dependency graph built ({graph_time:.2f}s) - {len(graph)} repositories analyzed")
+    graph_time = time.perf_counter_ns() - graph_start
+    info(f"Dependency graph built ({graph_time / 1e9:.2f}s) - {len(graph)} repositories analyzed")
 
     # Save graph as JSON
     project_root = get_project_root()
@@ -546,9 +760,12 @@ def _analyze_multi_repo(
 
     # Convert graph to serializable format
     graph_json = {repo: list(deps) for repo, deps in graph.items()}
-    graph_file.write_text(json.dumps(graph_json, indent=2))
+    write_json(graph_file, graph_json)
     info(f"Dependency graph saved: {graph_file}")
 
+    # Per-repo dependency checks reuse the full graph instead of rebuilding it
+    full_graph = graph
+
     # Filter if deps_only
     if deps_only:
         original_count = len(graph)
@@ -561,58 +778,93 @@ def _analyze_multi_repo(
         info("No repos to analyze")
         return
 
-    # Determine analysis order
+    # Determine analysis order. A repo becomes ready as soon as every repo it
+    # depends on has been analyzed, so there are no level-wide barriers.
+    cycles_by_repo: dict[str, list[dict]] = {}
     if respect_deps:
+        # Drop an edge from each cycle rather than refusing to analyze at all
         try:
-            levels = topological_sort(graph)
-            info(f"Analysis order: {len(levels)} levels")
-            for i, level in enumerate(levels, 1):
-                info(f"  Level {i}: {', '.join(level)}")
-        except ValueError as e:
-            error(str(e), exit_code=1)
+            order_graph, cycles = break_dependency_cycles(graph)
+        except CycleError as e:
+            error(f"Circular dependency detected in: {set(e.args[1])}", exit_code=1)
+        for cycle in cycles:
+            warn(cycle["message"])
+            cycles_by_repo.setdefault(cycle["repo"], []).append(cycle)
+
+        sorter = TopologicalSorter(order_graph)
+        info("Analysis order: dependencies before dependents")
     else:
-        # All in one level (parallel)
-        levels = [list(graph.keys())]
-        info(f"Analyzing {len(levels[0])} repos in parallel")
+        # No edges - every repo is ready immediately
+        sorter = TopologicalSorter({repo_name: () for repo_name in graph})
+        info(f"Analyzing {len(graph)} repos in parallel")
+
+    sorter.prepare()
+
+    resources_by_name = config.get_resources_by_name()
 
     # Count total repos for progress tracking
-    total_repos = sum(len(level) for level in levels)
+    total_repos = len(graph)
     current_repo = 0
 
-    # Track timing for each level
-    level_times = {}
-
-    # Analyze by level
-    for level_num, repos_in_level in enumerate(levels, 1):
-        level_start = time.time()
-        if respect_deps and len(levels) > 1:
-            info(f"\nLevel {level_num}/{len(levels)}: {', '.join(repos_in_level)}")
-
-        # Spawn agents for this level
-        agent_ids = []
-        for repo_name in repos_in_level:
-            current_repo += 1
-            agent_id = f"level-{level_num}-{repo_name}"
-
-            # Find resource
-            resource = next((r for r in config.get_all_resources() if r.name == repo_name), None)
-            if not resource:
-                warn(f"Resource not found: {repo_name}")
-                continue
-
-            resource_path = Path(resource.path).expanduser().resolve()
+    analysis_start = time.perf_counter_ns()
+    agent_ids = []
+
+    # Per-repo wall time from dispatch to completion, in completion order
+    repo_started: dict[str, int] = {}
+    repo_times: dict[str, int] = {}
+
+    # With --parallel, one orchestrator runs the analyzers of every ready repo
+    # in a shared pool; otherwise analyzers are CPU-bound, so each repo runs
+    # in its own process
+    orchestrator = None
+    executor = None
+    if parallel:
+        analyzer_names = _get_analyzer_list(focus)
+        orchestrator = AnalysisOrchestrator(
+            max_workers=max_workers
+            or _recommended_workers(total_repos * len(analyzer_names))
+        )
+    else:
+        # Imported here so single-repo runs skip loading multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
 
-            if background:
-                spawn_background_agent(
-                    agent_id=agent_id,
-                    command="analyze",
-                    args={"focus": focus} if focus else {},
-                    resource_path=str(resource_path),
-                )
-                agent_ids.append(agent_id)
-            else:
-                # Run synchronously (with optional parallel analyzers per repo)
-                _analyze_single_repo(
+        executor = ProcessPoolExecutor(max_workers=max_workers or os.cpu_count())
+    pending: dict[Future[tuple[str, int]], str] = {}
+    try:
+        while sorter.is_active():
+            ready: list[tuple[str, Path, int]] = []
+            for repo_name in sorter.get_ready():
+                current_repo += 1
+
+                # Find resource
+                resource = resources_by_name.get(repo_name)
+                if not resource:
+                    warn(f"Resource not found: {repo_name}")
+                    sorter.done(repo_name)
+                    continue
+
+                resource_path = resource.absolute_path
+
+                if background:
+                    agent_id = f"analyze-{repo_name}"
+                    spawn_background_agent(
+                        agent_id=agent_id,
+                        command="analyze",
+                        args={"focus": focus, "compress": compress},
+                        resource_path=str(resource_path),
+                    )
+                    agent_ids.append(agent_id)
+                    sorter.done(repo_name)
+                    continue
+
+                if executor is None:
+                    # --parallel: batch ready repos for the orchestrator
+                    ready.append((repo_name, resource_path, current_repo))
+                    continue
+
+                # Run in the pool
+                future = executor.submit(
+                    _analyze_repo_worker,
                     resource_path=resource_path,
                     focus=focus,
                     background=False,
@@ -625,26 +877,78 @@ def _analyze_multi_repo(
                     current_index=current_repo,
                     total_count=total_repos,
                     include_external=include_external,
-                    parallel=parallel,
-                    max_workers=max_workers,
+                    # Several repos may run at once; live displays cannot nest
+                    show_progress=False,
+                    graph=full_graph,
+                    timings=timings,
+                    dependency_cycles=cycles_by_repo.get(repo_name),
+                    compress=compress,
+                )
+                pending[future] = repo_name
+                repo_started[repo_name] = time.perf_counter_ns()
+
+            if orchestrator is not None and ready:
+                batch_start = time.perf_counter_ns()
+                results = orchestrator.analyze_parallel(
+                    repo_paths=[resource_path for _, resource_path, _ in ready],
+                    analyzers=analyzer_names,
+                    include_external=include_external,
                 )
+                for repo_name, resource_path, index in ready:
+                    _analyze_single_repo(
+                        resource_path=resource_path,
+                        focus=focus,
+                        background=False,
+                        agent_id=None,
+                        project_root=project_root,
+                        check_deps=True,
+                        config=config,
+                        cache_manager=cache_manager,
+                        no_cache=no_cache,
+                        current_index=index,
+                        total_count=total_repos,
+                        include_external=include_external,
+                        parallel=True,
+                        graph=full_graph,
+                        timings=timings,
+                        parallel_results=results.get(str(resource_path), []),
+                        dependency_cycles=cycles_by_repo.get(repo_name),
+                        compress=compress,
+                    )
+                    repo_times[repo_name] = time.perf_counter_ns() - batch_start
+                    sorter.done(repo_name)
 
-        # If background, wait for this level to complete before next
-        if background and respect_deps and agent_ids:
-            info(f"Waiting for level {level_num} to complete...")
-            # TODO: Implement wait for agents
-            # For now, just inform user
-            info(f"Use 'air status --agents' to monitor progress")
-            info(f"Agents: {', '.join(agent_ids)}")
+            if not pending:
+                continue
 
-        # Record level timing
-        level_times[f"Level {level_num}"] = time.time() - level_start
+            # Release dependents of whichever repos finish first, printing each
+            # repo's output as one block so concurrent repos don't interleave
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                repo_name = pending.pop(future)
+                output, exit_code = future.result()
+                repo_times[repo_name] = time.perf_counter_ns() - repo_started[repo_name]
+                click.echo(output, nl=False)
+                if exit_code:
+                    sys.exit(exit_code)
+                sorter.done(repo_name)
+    finally:
+        if orchestrator:
+            orchestrator.close()
+        if executor:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    analysis_time = time.perf_counter_ns() - analysis_start
+
+    if agent_ids:
+        info("Use 'air status --agents' to monitor progress")
+        info(f"Agents: {', '.join(agent_ids)}")
 
     # Detect cross-repo dependency gaps
-    gaps_start = time.time()
+    gaps_start = time.perf_counter_ns()
     info("\nChecking for dependency gaps...")
     gaps = detect_dependency_gaps(config, graph)
-    gaps_time = time.time() - gaps_start
+    gaps_time = time.perf_counter_ns() - gaps_start
     if gaps:
         warn(f"Found {len(gaps)} dependency issues:")
         for gap in gaps:
@@ -653,18 +957,22 @@ def _analyze_multi_repo(
         success("No dependency issues found")
 
     # Calculate total time and display timing summary
-    total_time = time.time() - multi_repo_start
-
-    info("")
-    info("⏱️  Multi-Repo Analysis Timing:")
-    info(f"  Dependency graph: {graph_time:.2f}s")
-    for level_name, level_time in level_times.items():
-        repo_count = len(levels[int(level_name.split()[1]) - 1])
-        info(f"  {level_name} ({repo_count} repos): {level_time:.2f}s")
-    info(f"  Dependency gap check: {gaps_time:.2f}s")
-    info(f"  Total: {total_time:.2f}s")
-    info(f"  Average per repo: {total_time / total_repos:.2f}s")
-    info("")
+    if timings:
+        total_time = time.perf_counter_ns() - multi_repo_start
+
+        info("")
+        info("⏱️  Multi-Repo Analysis Timing:")
+        info(f"  Dependency graph: {graph_time / 1e9:.2f}s")
+        info(f"  Repositories ({total_repos} repos): {analysis_time / 1e9:.2f}s")
+        info(f"  Dependency gap check: {gaps_time / 1e9:.2f}s")
+        info(f"  Total: {total_time / 1e9:.2f}s")
+        info(f"  Average per repo: {total_time / total_repos / 1e9:.2f}s")
+        if repo_times:
+            info("  Per repo (in completion order):")
+            width = max(len(repo_name) for repo_name in repo_times)
+            for repo_name, repo_time in repo_times.items():
+                info(f"    {repo_name:<{width}}  {repo_time / 1e9:.2f}s")
+        info("")
 
 
 def _analyze_gap(
@@ -672,18 +980,29 @@ def _analyze_gap(
     library_name: str,
     focus: str | None,
     include_external: bool = False,
+    cache_manager: CacheManager | None = None,
+    no_cache: bool = False,
+    compress: bool = False,
 ) -> None:
     """Perform gap analysis for a library vs its dependents.
 
+    Repos whose analyzers are all cached and whose findings file is current
+    are not re-analyzed; a reused dependent's report gets fresh gap findings.
+
     Args:
         config: AIR project configuration
         library_name: Name of library to analyze
         focus: Analysis focus area
+        cache_manager: Cache manager instance
+        no_cache: Skip cache lookup/storage
+        compress: Write findings as gzip-compressed JSON
     """
     info(f"Gap analysis: {library_name}")
 
+    resources_by_name = config.get_resources_by_name()
+
     # Find library resource
-    library_resource = next((r for r in config.get_all_resources() if r.name == library_name), None)
+    library_resource = resources_by_name.get(library_name)
     if not library_resource:
         error(f"Library not found: {library_name}", exit_code=1)
 
@@ -704,33 +1023,57 @@ def _analyze_gap(
 
     # Analyze library
     project_root = get_project_root()
-    library_path = Path(library_resource.path).expanduser().resolve()
+    if not project_root:
+        error(
+            "Not in an AIR project",
+            hint="Run 'air init' to create a project or 'cd' to project directory",
+            exit_code=1,
+        )
+    library_path = library_resource.absolute_path
 
     current_repo += 1
     info(f"\nAnalyzing library: {library_name}")
-    _analyze_single_repo(
-        resource_path=library_path,
-        focus=focus,
-        background=False,
-        agent_id=None,
-        project_root=project_root,
-        check_deps=False,
-        config=None,
-        current_index=current_repo,
-        total_count=total_repos,
-        include_external=include_external,
-    )
+    if _load_current_findings(project_root, library_path, focus, cache_manager, no_cache) is not None:
+        info(f"  {library_name}: all analyzers cached, reusing findings")
+    else:
+        _analyze_single_repo(
+            resource_path=library_path,
+            focus=focus,
+            background=False,
+            agent_id=None,
+            project_root=project_root,
+            check_deps=False,
+            config=None,
+            cache_manager=cache_manager,
+            no_cache=no_cache,
+            current_index=current_repo,
+            total_count=total_repos,
+            include_external=include_external,
+            compress=compress,
+        )
+
+    # Gaps depend only on the config and graph, so detect them once for both
+    # the dependents' reports and the summary
+    gaps = detect_dependency_gaps(config, graph)
 
     # Analyze dependents
     for dependent_name in dependents:
         current_repo += 1
-        dependent_resource = next((r for r in config.get_all_resources() if r.name == dependent_name), None)
+        dependent_resource = resources_by_name.get(dependent_name)
         if not dependent_resource:
             continue
 
-        dependent_path = Path(dependent_resource.path).expanduser().resolve()
+        dependent_path = dependent_resource.absolute_path
 
         info(f"\nAnalyzing dependent: {dependent_name}")
+        report = _load_current_findings(project_root, dependent_path, focus, cache_manager, no_cache)
+        if report is not None:
+            info(f"  {dependent_name}: all analyzers cached, reusing findings")
+            # The report's gap findings reflect the library version at the
+            # time it was written; bring them up to date
+            _refresh_gap_findings(project_root, dependent_path, report, gaps, compress)
+            continue
+
         _analyze_single_repo(
             resource_path=dependent_path,
             focus=focus,
@@ -739,9 +1082,13 @@ def _analyze_gap(
             project_root=project_root,
             check_deps=True,
             config=config,
+            cache_manager=cache_manager,
+            no_cache=no_cache,
             current_index=current_repo,
             total_count=total_repos,
             include_external=include_external,
+            graph=graph,
+            compress=compress,
         )
 
     # Show gaps
@@ -749,7 +1096,6 @@ def _analyze_gap(
     info("Gap Analysis Summary")
     info("="*60)
 
-    gaps = detect_dependency_gaps(config, graph)
     library_gaps = [g for g in gaps if library_name in (g.get('dependency'), g.get('repo'))]
 
     if library_gaps:
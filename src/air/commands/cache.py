@@ -51,11 +51,14 @@ def status(format: str) -> None:
         table.add_column("Metric", style="cyan")
         table.add_column("Value", style="green")
 
+        # hit_rate is computed on each access, so read it once
+        hit_rate = stats.hit_rate
+
         table.add_row("Total Entries", str(stats.total_entries))
         table.add_row("Cache Size", f"{stats.cache_size_mb:.2f} MB")
         table.add_row("Cache Hits", str(stats.hit_count))
         table.add_row("Cache Misses", str(stats.miss_count))
-        table.add_row("Hit Rate", f"{stats.hit_rate:.1f}%")
+        table.add_row("Hit Rate", f"{hit_rate:.1f}%")
 
         if stats.last_cleared:
             table.add_row("Last Cleared", stats.last_cleared.strftime("%Y-%m-%d %H:%M:%S"))
@@ -67,12 +70,12 @@ def status(format: str) -> None:
         # Show interpretation
         if stats.total_entries == 0:
             info("\nCache is empty. Run 'air analyze' to populate cache.")
-        elif stats.hit_rate >= 80:
-            success(f"\n✨ Excellent hit rate ({stats.hit_rate:.1f}%)!")
-        elif stats.hit_rate >= 50:
-            info(f"\n✓ Good hit rate ({stats.hit_rate:.1f}%)")
+        elif hit_rate >= 80:
+            success(f"\n✨ Excellent hit rate ({hit_rate:.1f}%)!")
+        elif hit_rate >= 50:
+            info(f"\n✓ Good hit rate ({hit_rate:.1f}%)")
         elif stats.hit_count + stats.miss_count > 0:
-            info(f"\nHit rate: {stats.hit_rate:.1f}% - Cache is warming up")
+            info(f"\nHit rate: {hit_rate:.1f}% - Cache is warming up")
 
 
 @cache.command()
@@ -2,17 +2,17 @@
 
 import json
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import click
-from rich.console import Console
-from rich.table import Table
 
-from air.core.models import AirConfig, Resource, ResourceType
-from air.services.classifier import classify_resource
+from air.core.models import AirConfig
+from air.services.cache_manager import CacheManager
+from air.services.classifier import classify_resource_cached
 from air.services.filesystem import get_config_path, get_project_root
-
-console = Console()
+from air.utils.console import console
+from air.utils.jsonio import dumps_json, write_json
 
 
 @click.command()
@@ -64,8 +64,7 @@ def classify(
     # Load config
     config_path = get_config_path(project_root)
     try:
-        with open(config_path) as f:
-            config = AirConfig.model_validate_json(f.read())
+        config = AirConfig.model_validate_json(config_path.read_bytes())
     except Exception as e:
         console.print(f"[red]✗[/red] Failed to load config: {e}")
         sys.exit(1)
@@ -88,13 +87,13 @@ def classify(
             sys.exit(1)
         resources = [resource]
 
-    # Classify each resource
+    # Classify each resource (unchanged repos are served from the cache)
+    cache_manager = CacheManager(cache_dir=project_root / ".air" / "cache")
     results = []
     updated_count = 0
 
-    for resource in resources:
-        resource_path = Path(resource.path)
-
+    resource_paths = [Path(resource.path) for resource in resources]
+    for resource, resource_path in zip(resources, resource_paths):
         # Check if resource path exists
         if not resource_path.exists():
             console.print(
@@ -106,8 +105,18 @@ def classify(
             )
             sys.exit(1)
 
-        result = classify_resource(resource_path)
+    # Classification is I/O-bound, so resources are walked concurrently;
+    # map() keeps results in resource order
+    with ThreadPoolExecutor(max_workers=min(16, len(resources))) as executor:
+        classifications = list(
+            executor.map(
+                classify_resource_cached,
+                resource_paths,
+                [cache_manager] * len(resource_paths),
+            )
+        )
 
+    for resource, result in zip(resources, classifications):
         results.append(
             {
                 "name": resource.name,
@@ -131,9 +140,7 @@ def classify(
     # Save updated config if changes were made
     if update and updated_count > 0:
         try:
-            with open(config_path, "w") as f:
-                f.write(config.model_dump_json(indent=2))
-                f.write("\n")
+            write_json(config_path, config.model_dump(mode="json"), durable=True)
         except Exception as e:
             console.print(f"[red]✗[/red] Failed to update config: {e}")
             sys.exit(1)
@@ -145,7 +152,7 @@ def classify(
             "updated": updated_count if update else 0,
             "resources": results,
         }
-        print(json.dumps(output, indent=2))
+        print(dumps_json(output).decode("utf-8"))
     else:
         _display_results(results, verbose, update, updated_count)
 
@@ -154,7 +161,9 @@ def _display_results(
     results: list[dict], verbose: bool, update: bool, updated_count: int
 ) -> None:
     """Display classification results in human-readable format."""
-    console.print(f"\n[bold]Classified {len(results)} resource(s)[/bold]\n")
+    # Build every line first and print once; each console.print call pays
+    # Rich's locking and render setup
+    lines = [f"\n[bold]Classified {len(results)} resource(s)[/bold]\n"]
 
     for result in results:
         # Status emoji
@@ -169,26 +178,28 @@ def _display_results(
         type_changed = result["current_type"] != result["detected_type"]
         change_indicator = " [yellow]→ CHANGED[/yellow]" if result.get("updated") else ""
 
-        console.print(f"{confidence_emoji} [bold]{result['name']}[/bold]{change_indicator}")
+        lines.append(f"{confidence_emoji} [bold]{result['name']}[/bold]{change_indicator}")
 
         if type_changed and not result.get("updated"):
-            console.print(
+            lines.append(
                 f"   Current: [dim]{result['current_type']}[/dim] → Detected: [cyan]{result['detected_type']}[/cyan]"
             )
         else:
-            console.print(f"   Type: [cyan]{result['detected_type']}[/cyan]")
+            lines.append(f"   Type: [cyan]{result['detected_type']}[/cyan]")
 
-        console.print(f"   Confidence: {result['confidence']:.0%}")
+        lines.append(f"   Confidence: {result['confidence']:.0%}")
 
         if verbose:
             if result["languages"]:
-                console.print(f"   Languages: {', '.join(result['languages'])}")
+                lines.append(f"   Languages: {', '.join(result['languages'])}")
             if result["frameworks"]:
-                console.print(f"   Frameworks: {', '.join(result['frameworks'])}")
-            console.print(f"   Reasoning: {result['reasoning']}")
-            console.print(f"   Path: [dim]{result['path']}[/dim]")
+                lines.append(f"   Frameworks: {', '.join(result['frameworks'])}")
+            lines.append(f"   Reasoning: {result['reasoning']}")
+            lines.append(f"   Path: [dim]{result['path']}[/dim]")
+
+        lines.append("")
 
-        console.print()
+    console.print("\n".join(lines))
 
     if update:
         if updated_count > 0:
@@ -1,7 +1,9 @@
 """Claude Code helper commands for AIR toolkit."""
 
-import json
+import heapq
+import os
 from pathlib import Path
+from typing import Any
 
 import click
 from rich.console import Console
@@ -43,16 +45,20 @@ def context(format: str) -> None:
     """
     project_root = get_project_root()
 
-    context_data = {}
+    context_data: dict[str, Any] = {}
 
     if project_root:
-        # Get AIR project status
-        config_path = get_config_path(project_root)
-        if config_path.exists():
+        # Get AIR project status (the parsed config also supplies the goals)
+        config = None
+        try:
+            config_bytes = get_config_path(project_root).read_bytes()
+        except FileNotFoundError:
+            config_bytes = None
+
+        if config_bytes is not None:
             try:
-                with open(config_path) as f:
-                    config_data = json.load(f)
-                    config = AirConfig(**config_data)
+                # Pydantic parses and validates the JSON in one pass
+                config = AirConfig.model_validate_json(config_bytes)
 
                 context_data["project"] = {
                     "name": config.name,
@@ -71,18 +77,27 @@ def context(format: str) -> None:
         tasks_dir = project_root / ".air" / "tasks"
         if tasks_dir.exists():
             try:
-                task_files = sorted(
-                    [f for f in tasks_dir.glob("*.md") if f.name != "TASKS.md"],
-                    key=lambda p: p.stat().st_mtime,
-                    reverse=True
-                )[:10]
+                # Select the 10 newest without sorting every task file;
+                # DirEntry.stat() reuses data from the directory scan
+                with os.scandir(tasks_dir) as entries:
+                    task_files = heapq.nlargest(
+                        10,
+                        (
+                            (entry.stat().st_mtime, entry.name)
+                            for entry in entries
+                            if entry.name.endswith(".md")
+                            and entry.name != "TASKS.md"
+                            and not entry.name.startswith(".")
+                            and entry.is_file()
+                        ),
+                    )
 
                 context_data["recent_tasks"] = [
                     {
-                        "file": str(f.relative_to(project_root)),
-                        "name": f.stem,
+                        "file": str((tasks_dir / name).relative_to(project_root)),
+                        "name": Path(name).stem,
                     }
-                    for f in task_files
+                    for _, name in task_files
                 ]
             except Exception:
                 context_data["recent_tasks"] = []
@@ -92,26 +107,23 @@ def context(format: str) -> None:
         # Get coding standards
         context_dir = project_root / ".air" / "context"
         if context_dir.exists():
-            standards = list(context_dir.glob("*.md"))
-            context_data["standards"] = [
-                {
-                    "name": s.stem,
-                    "path": str(s.relative_to(project_root)),
-                }
-                for s in standards
-            ]
+            with os.scandir(context_dir) as entries:
+                context_data["standards"] = [
+                    {
+                        "name": Path(entry.name).stem,
+                        "path": str((context_dir / entry.name).relative_to(project_root)),
+                    }
+                    for entry in entries
+                    if entry.name.endswith(".md")
+                    and not entry.name.startswith(".")
+                    and entry.is_file()
+                ]
         else:
             context_data["standards"] = []
 
         # Get project goals
-        config_path = get_config_path(project_root)
-        if config_path.exists():
-            try:
-                with open(config_path) as f:
-                    config = json.load(f)
-                    context_data["goals"] = config.get("goals", [])
-            except Exception:
-                context_data["goals"] = []
+        if config_bytes is not None:
+            context_data["goals"] = config.goals if config else []
 
     else:
         # Not an AIR project, provide minimal context
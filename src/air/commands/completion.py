@@ -1,6 +1,7 @@
 """Manage shell completion."""
 
 import os
+import re
 import sys
 from pathlib import Path
 
@@ -11,6 +12,8 @@ from air.utils.console import error, info, success, warn
 
 console = Console()
 
+COMPLETION_MARKER = "# air-toolkit completion"
+
 
 @click.group()
 def completion() -> None:
@@ -154,11 +157,66 @@ def detect_shell() -> str | None:
     return None
 
 
+def _install_record_path(shell: str) -> Path:
+    """Get the file recording that completion is installed for a shell.
+
+    Args:
+        shell: Shell name
+
+    Returns:
+        Path to the install record in the home directory
+    """
+    return Path.home() / f".air-completion-installed-{shell}"
+
+
+def _rc_signature(rc_file: Path) -> str:
+    """Get a cheap fingerprint of an rc file's contents.
+
+    Args:
+        rc_file: Shell rc file
+
+    Returns:
+        Modification time and size of the file
+    """
+    stat = rc_file.stat()
+    return f"{stat.st_mtime_ns} {stat.st_size}"
+
+
+def _is_recorded_installed(rc_file: Path, shell: str) -> bool:
+    """Check whether completion was recorded as installed in an unchanged rc file.
+
+    Args:
+        rc_file: Shell rc file
+        shell: Shell name
+
+    Returns:
+        True if the install record matches the rc file's current signature
+    """
+    try:
+        return _install_record_path(shell).read_text() == _rc_signature(rc_file)
+    except OSError:
+        return False
+
+
+def _record_installed(rc_file: Path, shell: str) -> None:
+    """Record that completion is installed in the rc file as it is now.
+
+    Args:
+        rc_file: Shell rc file
+        shell: Shell name
+    """
+    try:
+        _install_record_path(shell).write_text(_rc_signature(rc_file))
+    except OSError:
+        # The record is only a shortcut; installs still work without it
+        pass
+
+
 def _install_bash_completion() -> None:
     """Install bash completion to ~/.bashrc."""
     bashrc = Path.home() / ".bashrc"
     completion_line = 'eval "$(_AIR_COMPLETE=bash_source air)"'
-    marker = "# air-toolkit completion"
+    marker = COMPLETION_MARKER
 
     if not bashrc.exists():
         error(
@@ -167,15 +225,21 @@ def _install_bash_completion() -> None:
             exit_code=1,
         )
 
-    # Check if already installed
+    # Check if already installed, skipping the read if the rc file is
+    # unchanged since we last saw completion in it
+    if _is_recorded_installed(bashrc, "bash"):
+        warn("Completion already installed in ~/.bashrc")
+        return
     content = bashrc.read_text()
     if marker in content or completion_line in content:
+        _record_installed(bashrc, "bash")
         warn("Completion already installed in ~/.bashrc")
         return
 
     # Append completion
     with bashrc.open("a") as f:
         f.write(f"\n{marker}\n{completion_line}\n")
+    _record_installed(bashrc, "bash")
 
     success("Bash completion installed to ~/.bashrc")
     info("Run 'source ~/.bashrc' or restart your shell to activate")
@@ -185,7 +249,7 @@ def _install_zsh_completion() -> None:
     """Install zsh completion to ~/.zshrc."""
     zshrc = Path.home() / ".zshrc"
     completion_line = 'eval "$(_AIR_COMPLETE=zsh_source air)"'
-    marker = "# air-toolkit completion"
+    marker = COMPLETION_MARKER
 
     if not zshrc.exists():
         error(
@@ -194,15 +258,21 @@ def _install_zsh_completion() -> None:
             exit_code=1,
         )
 
-    # Check if already installed
+    # Check if already installed, skipping the read if the rc file is
+    # unchanged since we last saw completion in it
+    if _is_recorded_installed(zshrc, "zsh"):
+        warn("Completion already installed in ~/.zshrc")
+        return
     content = zshrc.read_text()
     if marker in content or completion_line in content:
+        _record_installed(zshrc, "zsh")
         warn("Completion already installed in ~/.zshrc")
         return
 
     # Append completion
     with zshrc.open("a") as f:
         f.write(f"\n{marker}\n{completion_line}\n")
+    _record_installed(zshrc, "zsh")
 
     success("Zsh completion installed to ~/.zshrc")
     info("Run 'source ~/.zshrc' or restart your shell to activate")
@@ -232,67 +302,49 @@ def _install_fish_completion() -> None:
     info("Restart your fish shell to activate")
 
 
+def _remove_completion_lines(content: str, completion_line: str) -> str:
+    """Remove the completion marker and eval lines from shell rc content.
+
+    Args:
+        content: Contents of the shell rc file
+        completion_line: Completion eval line for the shell
+
+    Returns:
+        Content without any line containing the marker or completion line
+    """
+    pattern = re.compile(
+        rf"^.*(?:{re.escape(COMPLETION_MARKER)}|{re.escape(completion_line)}).*(?:\n|\Z)",
+        re.MULTILINE,
+    )
+    content = pattern.sub("", content)
+    return content if content.endswith("\n") else content + "\n"
+
+
 def _uninstall_bash_completion() -> None:
     """Uninstall bash completion from ~/.bashrc."""
     bashrc = Path.home() / ".bashrc"
-    marker = "# air-toolkit completion"
     completion_line = 'eval "$(_AIR_COMPLETE=bash_source air)"'
 
     if not bashrc.exists():
         warn("~/.bashrc not found, nothing to uninstall")
         return
 
-    # Read and filter out completion lines
-    lines = bashrc.read_text().splitlines()
-    filtered_lines = []
-    skip_next = False
-
-    for line in lines:
-        if marker in line:
-            skip_next = True
-            continue
-        if skip_next and completion_line in line:
-            skip_next = False
-            continue
-        filtered_lines.append(line)
-
-    # Also handle case where marker isn't present but completion line is
-    filtered_lines = [l for l in filtered_lines if completion_line not in l]
-
-    # Write back
-    bashrc.write_text("\n".join(filtered_lines) + "\n")
+    bashrc.write_text(_remove_completion_lines(bashrc.read_text(), completion_line))
+    _install_record_path("bash").unlink(missing_ok=True)
     success("Bash completion uninstalled from ~/.bashrc")
 
 
 def _uninstall_zsh_completion() -> None:
     """Uninstall zsh completion from ~/.zshrc."""
     zshrc = Path.home() / ".zshrc"
-    marker = "# air-toolkit completion"
     completion_line = 'eval "$(_AIR_COMPLETE=zsh_source air)"'
 
     if not zshrc.exists():
         warn("~/.zshrc not found, nothing to uninstall")
         return
 
-    # Read and filter out completion lines
-    lines = zshrc.read_text().splitlines()
-    filtered_lines = []
-    skip_next = False
-
-    for line in lines:
-        if marker in line:
-            skip_next = True
-            continue
-        if skip_next and completion_line in line:
-            skip_next = False
-            continue
-        filtered_lines.append(line)
-
-    # Also handle case where marker isn't present but completion line is
-    filtered_lines = [l for l in filtered_lines if completion_line not in l]
-
-    # Write back
-    zshrc.write_text("\n".join(filtered_lines) + "\n")
+    zshrc.write_text(_remove_completion_lines(zshrc.read_text(), completion_line))
+    _install_record_path("zsh").unlink(missing_ok=True)
     success("Zsh completion uninstalled from ~/.zshrc")
 
 
@@ -1,17 +1,25 @@
 """View analysis findings."""
 
 import json
+import os
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import click
-from rich.console import Console
-from rich.table import Table
 
 from air.services.filesystem import get_project_root
 from air.services.html_report_generator import generate_findings_html
-from air.utils.console import error, info, success
+from air.utils.console import console, error, info, success
+from air.utils.jsonio import dumps_json, read_json
 
-console = Console()
+_SEVERITY_STYLES = {
+    "critical": ("⚠️", "red"),
+    "high": ("⚠️", "red"),
+    "medium": ("⚡", "yellow"),
+    "low": ("ℹ️", "blue"),
+}
+_DEFAULT_SEVERITY_STYLE = ("·", "dim")
 
 
 def _get_severity_style(severity: str) -> tuple[str, str]:
@@ -23,26 +31,62 @@ def _get_severity_style(severity: str) -> tuple[str, str]:
     Returns:
         Tuple of (emoji, style)
     """
-    if severity in ["critical", "high"]:
-        return "⚠️", "red"
-    elif severity == "medium":
-        return "⚡", "yellow"
-    elif severity == "low":
-        return "ℹ️", "blue"
+    return _SEVERITY_STYLES.get(severity, _DEFAULT_SEVERITY_STYLE)
+
+
+def _matches_filter(value: str, wanted: str) -> bool:
+    """Check a finding field against a lowercased filter, ignoring case.
+
+    Analyzers write lowercase severities and categories, so the lowercase
+    copy is only made for values that actually contain uppercase letters.
+
+    Args:
+        value: Field value from a finding
+        wanted: Lowercased filter value
+
+    Returns:
+        True if the value matches the filter
+    """
+    if value == wanted:
+        return True
+    return not value.islower() and value.lower() == wanted
+
+
+def _read_findings_file(findings_file: Path) -> list | None:
+    """Read the findings list from a findings report.
+
+    Args:
+        findings_file: Path to a *-findings.json or *-findings.json.gz file
+
+    Returns:
+        List of findings, or None if the file could not be read
+    """
+    try:
+        findings_data = read_json(findings_file)
+    except (OSError, ValueError):
+        return None
+
+    # Reports are {"repository", "classification", "findings"}; older
+    # files hold the bare findings list
+    findings: list | None
+    if isinstance(findings_data, dict):
+        findings = findings_data.get("findings", [])
     else:
-        return "·", "dim"
+        findings = findings_data
+    return findings
 
 
-def _show_summary_counts(findings_list: list) -> None:
+def _show_summary_counts(findings_list: list, severity_counts: Counter) -> None:
     """Show summary counts at bottom of output.
 
     Args:
         findings_list: List of findings
+        severity_counts: Number of findings per severity
     """
-    critical_count = sum(1 for f in findings_list if f.get("severity") == "critical")
-    high_count = sum(1 for f in findings_list if f.get("severity") == "high")
-    medium_count = sum(1 for f in findings_list if f.get("severity") == "medium")
-    low_count = sum(1 for f in findings_list if f.get("severity") == "low")
+    critical_count = severity_counts["critical"]
+    high_count = severity_counts["high"]
+    medium_count = severity_counts["medium"]
+    low_count = severity_counts["low"]
 
     console.print()
     console.print(
@@ -54,33 +98,23 @@ def _show_summary_counts(findings_list: list) -> None:
     console.print()
 
 
-def _show_summary(findings_list: list) -> None:
+def _show_summary(findings_list: list, severity_counts: Counter) -> None:
     """Show summary statistics view.
 
     Args:
         findings_list: List of findings
+        severity_counts: Number of findings per severity
     """
     console.print()
     console.print("[bold cyan]Findings Summary[/bold cyan]")
     console.print()
 
-    # Count by category
-    by_category = {}
-    for finding in findings_list:
-        cat = finding.get("category", "unknown")
-        by_category[cat] = by_category.get(cat, 0) + 1
-
-    # Count by severity
-    by_severity = {}
+    # Count by category and source in one pass
+    by_category: Counter[str] = Counter()
+    by_source: Counter[str] = Counter()
     for finding in findings_list:
-        sev = finding.get("severity", "info")
-        by_severity[sev] = by_severity.get(sev, 0) + 1
-
-    # Count by source
-    by_source = {}
-    for finding in findings_list:
-        src = finding.get("source", "unknown")
-        by_source[src] = by_source.get(src, 0) + 1
+        by_category[finding.get("category", "unknown")] += 1
+        by_source[finding.get("source", "unknown")] += 1
 
     # Display totals
     console.print(f"[bold]Total Findings:[/bold] {len(findings_list)}")
@@ -89,7 +123,7 @@ def _show_summary(findings_list: list) -> None:
     # Severity breakdown
     console.print("[bold]By Severity:[/bold]")
     for sev in ["critical", "high", "medium", "low", "info"]:
-        count = by_severity.get(sev, 0)
+        count = severity_counts[sev]
         if count > 0:
             emoji, style = _get_severity_style(sev)
             console.print(f"  [{style}]{emoji} {sev.capitalize()}:[/{style}] {count}")
@@ -108,61 +142,63 @@ def _show_summary(findings_list: list) -> None:
     console.print()
 
 
-def _show_details(findings_list: list) -> None:
+def _show_details(findings_list: list, severity_counts: Counter) -> None:
     """Show detailed findings view.
 
     Args:
         findings_list: List of findings
+        severity_counts: Number of findings per severity
     """
-    console.print()
-    console.print("[bold cyan]Detailed Findings[/bold cyan]")
-    console.print()
+    # Build every line first and print once; each console.print call pays
+    # for markup parsing and a write
+    lines = ["", "[bold cyan]Detailed Findings[/bold cyan]", ""]
 
     for i, finding in enumerate(findings_list, 1):
         # Header
         severity_val = finding.get("severity", "info")
         emoji, style = _get_severity_style(severity_val)
 
-        console.print(f"[bold]{i}. [{style}]{emoji} {severity_val.upper()}[/{style}][/bold]")
+        lines.append(f"[bold]{i}. [{style}]{emoji} {severity_val.upper()}[/{style}][/bold]")
 
         # Title
         title = finding.get("title", finding.get("type", "No title"))
-        console.print(f"   [bold]{title}[/bold]")
+        lines.append(f"   [bold]{title}[/bold]")
 
         # Category and source
         category = finding.get("category", "unknown")
         source = finding.get("source", "unknown")
-        console.print(f"   [dim]Category: {category} | Source: {source}[/dim]")
+        lines.append(f"   [dim]Category: {category} | Source: {source}[/dim]")
 
         # Location
         location = finding.get("location")
         line_number = finding.get("line_number")
         if location:
             if line_number:
-                console.print(f"   [cyan]Location: {location}:{line_number}[/cyan]")
+                lines.append(f"   [cyan]Location: {location}:{line_number}[/cyan]")
             else:
-                console.print(f"   [cyan]Location: {location}[/cyan]")
+                lines.append(f"   [cyan]Location: {location}[/cyan]")
 
         # Description
         description = finding.get("description", finding.get("reasoning", ""))
         if description:
-            console.print(f"   {description}")
+            lines.append(f"   {description}")
 
         # Suggestion
         suggestion = finding.get("suggestion")
         if suggestion:
-            console.print(f"   [green]💡 Suggestion:[/green] {suggestion}")
+            lines.append(f"   [green]💡 Suggestion:[/green] {suggestion}")
 
         # Metadata
         metadata = finding.get("metadata")
         if metadata and isinstance(metadata, dict):
             details = ", ".join(f"{k}={v}" for k, v in metadata.items() if k != "match")
             if details:
-                console.print(f"   [dim]Details: {details}[/dim]")
+                lines.append(f"   [dim]Details: {details}[/dim]")
 
-        console.print()
+        lines.append("")
 
-    _show_summary_counts(findings_list)
+    console.print("\n".join(lines))
+    _show_summary_counts(findings_list, severity_counts)
 
 
 @click.command()
@@ -221,33 +257,45 @@ def findings(
             console.print("\n[dim]Use 'air analyze' to generate findings[/dim]\n")
         return
 
-    # Collect all findings
+    # Collect all findings, dropping filtered-out ones and counting severities
+    # as they are loaded
     all_findings_list = []
+    severity_counts: Counter[str] = Counter()
+    severity_filter = severity.lower() if severity else None
+    category_filter = category.lower() if category else None
+
+    # One directory scan picks up both plain and compressed reports
+    with os.scandir(analysis_dir) as entries:
+        findings_files = [
+            Path(entry.path)
+            for entry in entries
+            if entry.name.endswith(("-findings.json", "-findings.json.gz"))
+            and not entry.name.startswith(".")
+            and entry.is_file()
+        ]
+
+    # Reads and parsing release the GIL, so load the files concurrently
+    loaded = []
+    if findings_files:
+        with ThreadPoolExecutor(max_workers=min(16, len(findings_files))) as executor:
+            loaded = list(executor.map(_read_findings_file, findings_files))
 
-    for findings_file in analysis_dir.glob("*-findings.json"):
-        try:
-            findings_data = json.loads(findings_file.read_text())
-            for finding in findings_data:
-                # Add source file info
-                finding["source"] = findings_file.stem.replace("-findings", "")
-                all_findings_list.append(finding)
-        except json.JSONDecodeError:
+    for findings_file, findings_data in zip(findings_files, loaded):
+        if findings_data is None:
             # Skip corrupted files
             continue
 
-    # Filter by severity if requested
-    if severity:
-        all_findings_list = [
-            f for f in all_findings_list
-            if f.get("severity", "").lower() == severity.lower()
-        ]
+        source = findings_file.name.partition("-findings.json")[0]
+        for finding in findings_data:
+            if severity_filter and not _matches_filter(finding.get("severity", ""), severity_filter):
+                continue
+            if category_filter and not _matches_filter(finding.get("category", ""), category_filter):
+                continue
 
-    # Filter by category if requested
-    if category:
-        all_findings_list = [
-            f for f in all_findings_list
-            if f.get("category", "").lower() == category.lower()
-        ]
+            # Add source file info
+            finding["source"] = source
+            all_findings_list.append(finding)
+            severity_counts[finding.get("severity", "info")] += 1
 
     # HTML output
     if html:
@@ -277,7 +325,8 @@ def findings(
             "findings": all_findings_list,
             "count": len(all_findings_list),
         }
-        print(json.dumps(result, indent=2))
+        # click.echo writes bytes straight to the binary stream
+        click.echo(dumps_json(result))
         return
 
     # Human-readable output
@@ -290,25 +339,34 @@ def findings(
 
     # Summary view
     if summary:
-        _show_summary(all_findings_list)
+        _show_summary(all_findings_list, severity_counts)
         return
 
     # Details view
     if details:
-        _show_details(all_findings_list)
+        _show_details(all_findings_list, severity_counts)
         return
 
-    # Default: Table view
+    # Default: Table view (rich.table is only needed here)
+    from rich.table import Table
+
     table = Table(title="[bold]Analysis Findings[/bold]", show_header=True)
     table.add_column("Source", style="cyan", no_wrap=True)
     table.add_column("Severity", style="yellow")
     table.add_column("Category", style="green")
     table.add_column("Title/Description", style="white")
 
+    # Severity cells repeat across rows; build each distinct one once
+    severity_cells: dict[str, str] = {}
+
     for finding in all_findings_list:
         # Severity styling
         severity_val = finding.get("severity", "info")
-        sev_emoji, sev_style = _get_severity_style(severity_val)
+        severity_cell = severity_cells.get(severity_val)
+        if severity_cell is None:
+            sev_emoji, sev_style = _get_severity_style(severity_val)
+            severity_cell = f"[{sev_style}]{sev_emoji} {severity_val.capitalize()}[/{sev_style}]"
+            severity_cells[severity_val] = severity_cell
 
         # Get title or description
         title = finding.get("title", finding.get("reasoning", finding.get("type", "No title")))
@@ -317,7 +375,7 @@ def findings(
 
         table.add_row(
             finding.get("source", "unknown"),
-            f"[{sev_style}]{sev_emoji} {severity_val.capitalize()}[/{sev_style}]",
+            severity_cell,
             finding.get("category", "unknown"),
             title,
         )
@@ -326,4 +384,4 @@ def findings(
     console.print(table)
 
     # Summary counts
-    _show_summary_counts(all_findings_list)
+    _show_summary_counts(all_findings_list, severity_counts)
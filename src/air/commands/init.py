@@ -1,5 +1,6 @@
 """Initialize new AIR assessment project."""
 
+import os
 from datetime import datetime
 from pathlib import Path
 
@@ -7,10 +8,11 @@ import click
 
 from air.core.models import ProjectMode, ProjectStructure
 from air.services.filesystem import (
+    batch_write,
     create_directory,
-    create_file,
     get_config_path,
     get_project_root,
+    is_project_root,
 )
 from air.services.templates import (
     create_config_file,
@@ -18,7 +20,7 @@ from air.services.templates import (
     render_ai_templates,
     render_assessment_templates,
 )
-from air.utils.console import error, info, success, warn
+from air.utils.console import console, error, info, success, warn
 
 
 @click.command()
@@ -65,6 +67,25 @@ def init(name: str | None, mode: str, track: bool, create_dir: bool, interactive
     if interactive:
         return _init_interactive()
 
+    _init_project(name, mode, track, create_dir)
+
+
+def _init_project(
+    name: str | None,
+    mode: str,
+    track: bool,
+    create_dir: bool,
+    goals: list[str] | None = None,
+) -> None:
+    """Create or initialize an AIR project.
+
+    Args:
+        name: Project directory name, or None for the current directory
+        mode: Project mode (review, develop, mixed)
+        track: Whether to set up .air/ task tracking
+        create_dir: Whether NAME must be created as a new directory
+        goals: Optional project goals to record in the config
+    """
     # Determine behavior based on arguments
     if name is None:
         # No name: initialize in current directory
@@ -101,16 +122,25 @@ def init(name: str | None, mode: str, track: bool, create_dir: bool, interactive
 
     info(f"Mode: {mode}")
 
-    # Check if already in an AIR project (unless initializing current dir)
-    existing_root = get_project_root()
-    if existing_root is not None:
-        if existing_root == project_dir.resolve():
+    # Check if already in an AIR project. A new directory may be nested in an
+    # existing project, so only the target itself needs checking; otherwise
+    # look for a project in the current directory or its parents.
+    if creating_new_dir:
+        if is_project_root(project_dir):
             error(
                 "This directory is already an AIR project",
                 hint="AIR project already initialized here",
                 exit_code=1,
             )
-        elif not creating_new_dir:
+    else:
+        existing_root = get_project_root()
+        if existing_root is not None:
+            if existing_root == project_dir.resolve():
+                error(
+                    "This directory is already an AIR project",
+                    hint="AIR project already initialized here",
+                    exit_code=1,
+                )
             error(
                 f"Already in an AIR project: {existing_root}",
                 hint="Create new project in a different directory with --create-dir",
@@ -120,8 +150,10 @@ def init(name: str | None, mode: str, track: bool, create_dir: bool, interactive
     # Check if directory exists and has content
     if project_dir.exists():
         if creating_new_dir:
-            # Creating new directory - should be empty
-            if any(project_dir.iterdir()):
+            # Creating new directory - should be empty; stop at the first entry
+            with os.scandir(project_dir) as entries:
+                is_empty = next(entries, None) is None
+            if not is_empty:
                 error(
                     f"Directory not empty: {project_dir}",
                     hint="Use an empty directory or specify a different name",
@@ -129,15 +161,12 @@ def init(name: str | None, mode: str, track: bool, create_dir: bool, interactive
                 )
         else:
             # Initializing in existing directory - warn if has files
-            existing_files = list(project_dir.iterdir())
-            if existing_files:
-                # Filter out hidden files/dirs for count
-                visible_files = [f for f in existing_files if not f.name.startswith(".")]
-                if visible_files:
-                    warn(
-                        f"Initializing AIR in directory with {len(visible_files)} existing files"
-                    )
-                    info("AIR files will be added alongside existing content")
+            # (hidden files/dirs are not counted)
+            with os.scandir(project_dir) as entries:
+                visible_count = sum(1 for entry in entries if not entry.name.startswith("."))
+            if visible_count:
+                warn(f"Initializing AIR in directory with {visible_count} existing files")
+                info("AIR files will be added alongside existing content")
 
     # Create project directory if needed
     if not project_dir.exists():
@@ -149,48 +178,41 @@ def init(name: str | None, mode: str, track: bool, create_dir: bool, interactive
 
     # Create directories
     info("Creating directory structure...")
-    for directory in structure.directories:
-        dir_path = project_dir / directory
-        create_directory(dir_path)
-
-        # Create .gitkeep for resource directories
-        if directory == "repos":
-            gitkeep = dir_path / ".gitkeep"
-            create_file(gitkeep, "", overwrite=True)
+    # Parents are created along with their subdirectories, so only the
+    # deepest entries need a mkdir call
+    directories = structure.directories
+    for directory in directories:
+        if not any(other.startswith(f"{directory}/") for other in directories):
+            create_directory(project_dir / directory)
 
     # Render and create template files
     info("Generating project files...")
     created = datetime.now()
 
-    # Assessment templates
-    assessment_files = render_assessment_templates(project_name, mode, created)
-    for filename, content in assessment_files.items():
-        file_path = project_dir / filename
-        create_file(file_path, content, overwrite=True)
+    # Assessment templates (paths relative to the project directory)
+    project_files = render_assessment_templates(project_name, mode, created)
+
+    # Keep the resource directory in version control
+    if "repos" in structure.directories:
+        project_files["repos/.gitkeep"] = ""
 
     # Config file (use new location .air/air-config.json)
-    config_content = create_config_file(project_name, mode, created)
     config_path = get_config_path(project_dir)
-    create_file(config_path, config_content, overwrite=True)
+    project_files[str(config_path.relative_to(project_dir))] = create_config_file(
+        project_name, mode, created, goals
+    )
 
-    # AI tracking templates
+    # AI tracking templates and context files
     if track:
-        ai_files = render_ai_templates()
-        for filename, content in ai_files.items():
-            file_path = project_dir / filename
-            create_file(file_path, content, overwrite=True)
-
-        # Create context files
+        project_files.update(render_ai_templates())
         for context_type in ["architecture", "language"]:
-            context_content = get_context_template(context_type)
-            context_path = project_dir / f".air/context/{context_type}.md"
-            create_file(context_path, context_content, overwrite=True)
+            project_files[f".air/context/{context_type}.md"] = get_context_template(context_type)
 
-        # Create templates directory
-        templates_dir = project_dir / ".air/templates"
-        create_directory(templates_dir)
+    # Write everything with one directory lookup per target directory
+    batch_write(project_dir, project_files)
 
-        # Copy Claude Code slash commands
+    # Copy Claude Code slash commands
+    if track:
         _create_claude_commands(project_dir)
 
     if creating_new_dir:
@@ -219,11 +241,8 @@ def init(name: str | None, mode: str, track: bool, create_dir: bool, interactive
 
 def _init_interactive() -> None:
     """Interactive project initialization with prompts."""
-    from rich.console import Console
-    from rich.prompt import Confirm, Prompt
     from rich.panel import Panel
-
-    console = Console()
+    from rich.prompt import Confirm, Prompt
 
     # Welcome message
     console.print(Panel.fit(
@@ -234,21 +253,24 @@ def _init_interactive() -> None:
     console.print()
 
     # Project name
-    default_name = Path.cwd().name
+    cwd = Path.cwd()
+    default_name = cwd.name
     project_name = Prompt.ask(
         "[cyan]Project name[/cyan]",
-        default=default_name
+        default=default_name,
+        console=console,
     )
 
     # Create new directory?
     if project_name != default_name:
         create_dir = Confirm.ask(
             f"Create new directory '{project_name}'?",
-            default=True
+            default=True,
+            console=console,
         )
     else:
         create_dir = False
-        console.print(f"[dim]✓ Using current directory: {Path.cwd()}[/dim]")
+        console.print(f"[dim]✓ Using current directory: {cwd}[/dim]")
         console.print()
 
     # Project mode
@@ -261,27 +283,30 @@ def _init_interactive() -> None:
     mode_choice = Prompt.ask(
         "Select mode",
         choices=["review", "develop", "mixed"],
-        default="mixed"
+        default="mixed",
+        console=console,
     )
 
     # Task tracking
     track = Confirm.ask(
         "Enable task tracking (.air/ directory)?",
-        default=True
+        default=True,
+        console=console,
     )
 
     # Project goals (optional)
     console.print()
     add_goals = Confirm.ask(
         "Would you like to add project goals?",
-        default=False
+        default=False,
+        console=console,
     )
 
     goals = []
     if add_goals:
         console.print("[dim]Enter goals (one per line, empty line to finish):[/dim]")
         while True:
-            goal = Prompt.ask(f"Goal {len(goals) + 1}", default="")
+            goal = Prompt.ask(f"Goal {len(goals) + 1}", default="", console=console)
             if not goal:
                 break
             goals.append(goal)
@@ -300,36 +325,15 @@ def _init_interactive() -> None:
     ))
     console.print()
 
-    if not Confirm.ask("Create project with these settings?", default=True):
+    if not Confirm.ask("Create project with these settings?", default=True, console=console):
         console.print("[yellow]✗[/yellow] Cancelled")
         return
 
-    # Call init with collected parameters
+    # Initialize with collected parameters; goals go straight into the config
     console.print()
-    ctx = click.get_current_context()
-
-    # Temporarily disable interactive mode to avoid recursion
-    if create_dir:
-        ctx.invoke(init, name=project_name, mode=mode_choice, track=track,
-                   create_dir=True, interactive=False)
-    else:
-        ctx.invoke(init, name=None, mode=mode_choice, track=track,
-                   create_dir=False, interactive=False)
+    _init_project(project_name if create_dir else None, mode_choice, track, create_dir, goals)
 
-    # Add goals to config if provided
     if goals:
-        project_dir = Path.cwd() / project_name if create_dir else Path.cwd()
-        config_path = get_config_path(project_dir)
-
-        import json
-        with open(config_path) as f:
-            config_data = json.load(f)
-
-        config_data["goals"] = goals
-
-        with open(config_path, "w") as f:
-            json.dump(config_data, f, indent=2)
-
         info(f"Added {len(goals)} goal(s) to configuration")
 
 
@@ -360,25 +364,26 @@ def _create_claude_commands(project_dir: Path) -> None:
 
     # Copy each command file from templates
     try:
+        # Resolve the template location once rather than once per file
+        try:
+            templates = importlib.resources.files("air.templates.claude_commands")
+        except ModuleNotFoundError:
+            # Fallback: read from the source directory during development
+            templates = Path(__file__).parent.parent / "templates" / "claude_commands"
+
+        # Templates are copied verbatim, so keep them as bytes end to end
+        commands = {}
         for command_file in command_files:
-            # Read from embedded templates
             try:
-                template_content = importlib.resources.read_text(
-                    "air.templates.claude_commands", command_file
-                )
+                template_content = (templates / command_file).read_bytes()
             except FileNotFoundError:
-                # Fallback: try reading from source directory during development
-                template_path = Path(__file__).parent.parent / "templates" / "claude_commands" / command_file
-                if template_path.exists():
-                    template_content = template_path.read_text()
-                else:
-                    warn(f"Claude command template not found: {command_file}")
-                    continue
-
-            # Write to project
-            command_path = commands_dir / command_file
-            create_file(command_path, template_content, overwrite=True)
+                warn(f"Claude command template not found: {command_file}")
+                continue
+
+            commands[command_file] = template_content
 
+        # Write to project
+        batch_write(commands_dir, commands)
         info("Created Claude Code slash commands in .claude/commands/")
     except Exception as e:
         warn(f"Could not create Claude commands: {e}")
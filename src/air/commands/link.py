@@ -9,6 +9,7 @@ from rich.console import Console
 from air.core.models import AirConfig, Resource, ResourceRelationship, ResourceType
 from air.services.filesystem import create_symlink, get_config_path, get_project_root
 from air.utils.console import error, info, success, warn
+from air.utils.jsonio import write_json
 from air.utils.tables import render_resource_table
 
 console = Console()
@@ -36,9 +37,7 @@ def load_config(project_root: Path) -> AirConfig:
         )
 
     try:
-        with open(config_path) as f:
-            config_data = json.load(f)
-        return AirConfig(**config_data)
+        return AirConfig.model_validate_json(config_path.read_bytes())
     except Exception as e:
         error(
             f"Failed to load configuration: {e}",
@@ -60,10 +59,8 @@ def save_config(project_root: Path, config: AirConfig) -> None:
     config_path = get_config_path(project_root)
 
     try:
-        with open(config_path, "w") as f:
-            # Use model_dump for Pydantic v2
-            json.dump(config.model_dump(mode="json"), f, indent=2, default=str)
-            f.write("\n")  # Add trailing newline
+        # Use model_dump for Pydantic v2; replaced atomically with a trailing newline
+        write_json(config_path, config.model_dump(mode="json"), durable=True)
     except Exception as e:
         error(
             f"Failed to save configuration: {e}",
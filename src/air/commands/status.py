@@ -93,9 +93,7 @@ def status(
             )
 
     try:
-        with open(config_path) as f:
-            config_data = json.load(f)
-            config = AirConfig(**config_data)
+        config = AirConfig.model_validate_json(config_path.read_bytes())
     except Exception as e:
         if output_format == "json":
             print(json.dumps({"success": False, "error": f"Invalid config: {e}"}))
@@ -1,7 +1,10 @@
 """Data models for AIR toolkit."""
 
+import os
 from datetime import datetime
 from enum import StrEnum
+from functools import cache, cached_property
+from pathlib import Path
 from typing import Any
 
 from pydantic import BaseModel, Field, field_validator
@@ -76,10 +79,17 @@ class Resource(BaseModel):
     @classmethod
     def expand_path(cls, v: str) -> str:
         """Expand ~ in paths."""
-        from pathlib import Path
-
         return str(Path(v).expanduser())
 
+    @cached_property
+    def absolute_path(self) -> Path:
+        """Absolute path to the resource, computed once per resource.
+
+        Uses os.path.abspath rather than Path.resolve() to avoid a readlink
+        per path component.
+        """
+        return Path(os.path.abspath(self.path))
+
 
 class AirConfig(BaseModel):
     """Project configuration (air-config.json)."""
@@ -111,6 +121,19 @@ class AirConfig(BaseModel):
             all_resources.extend(resources_list)
         return all_resources
 
+    def get_resources_by_name(self) -> dict[str, Resource]:
+        """Get all resources indexed by name.
+
+        Build this once per command when looking up many resources by name.
+
+        Returns:
+            Dict mapping resource name to resource (first match wins)
+        """
+        resources_by_name: dict[str, Resource] = {}
+        for resource in self.get_all_resources():
+            resources_by_name.setdefault(resource.name, resource)
+        return resources_by_name
+
     def find_resource(self, name: str) -> Resource | None:
         """Find resource by name.
 
@@ -173,9 +196,12 @@ class ProjectStructure(BaseModel):
     optional_files: list[str]
 
     @classmethod
+    @cache
     def for_mode(cls, mode: ProjectMode) -> "ProjectStructure":
         """Get expected structure for project mode.
 
+        Structures are built once per mode and shared; treat them as read-only.
+
         Args:
             mode: Project mode
 
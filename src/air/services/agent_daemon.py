@@ -0,0 +1,243 @@
+"""Pre-warmed daemon for spawning background agents.
+
+Opt-in with ``AIR_DAEMON=1``. The daemon imports the CLI and analyzers once,
+then forks a child per request, so background agents skip interpreter
+start-up and module imports. Requests arrive as one JSON line over a Unix
+socket in the project's .air directory; when the daemon is unavailable,
+callers fall back to spawning a fresh ``air`` process.
+"""
+
+import json
+import os
+import signal
+import socket
+import subprocess
+import sys
+import traceback
+from pathlib import Path
+from typing import Any
+
+from air import __version__
+
+# Relative to the project root (keeps the path within the AF_UNIX length limit)
+DAEMON_SOCKET = Path(".air/daemon.sock")
+
+# Held (flock) by the running daemon so only one serves each project
+DAEMON_LOCK = Path(".air/daemon.lock")
+DAEMON_ENV_VAR = "AIR_DAEMON"
+
+# Seconds to wait on a daemon before falling back to a fresh process
+CONNECT_TIMEOUT = 2.0
+
+# Seconds without requests before the daemon exits
+IDLE_TIMEOUT = 600.0
+
+
+def daemon_enabled() -> bool:
+    """Check whether background agents should use the daemon.
+
+    Returns:
+        True if opted in via AIR_DAEMON=1 and the platform supports it
+    """
+    return (
+        os.environ.get(DAEMON_ENV_VAR) == "1"
+        and hasattr(socket, "AF_UNIX")
+        and hasattr(os, "fork")
+    )
+
+
+def submit_to_daemon(cmd_args: list[str], stdout_path: Path, stderr_path: Path) -> int | None:
+    """Ask the running daemon to start a background agent.
+
+    Args:
+        cmd_args: Arguments for the air CLI (without the program name)
+        stdout_path: File to receive the agent's stdout
+        stderr_path: File to receive the agent's stderr
+
+    Returns:
+        PID of the agent process, or None if no daemon handled the request
+    """
+    if not DAEMON_SOCKET.exists():
+        return None
+
+    request = {
+        "air_version": __version__,
+        "args": cmd_args,
+        "cwd": str(Path.cwd()),
+        "stdout": str(stdout_path.resolve()),
+        "stderr": str(stderr_path.resolve()),
+    }
+
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(CONNECT_TIMEOUT)
+            sock.connect(str(DAEMON_SOCKET))
+            sock.sendall(json.dumps(request).encode("utf-8") + b"\n")
+            with sock.makefile("rb") as reader:
+                response = json.loads(reader.readline())
+    except (OSError, ValueError):
+        return None
+
+    pid = response.get("pid")
+    return pid if isinstance(pid, int) else None
+
+
+def _acquire_lock() -> int | None:
+    """Take the daemon lock without blocking.
+
+    The lock is released by the kernel when its holder exits, so a crashed
+    daemon never leaves a stale lock behind.
+
+    Returns:
+        File descriptor holding the lock, or None if another process holds it
+    """
+    import fcntl
+
+    DAEMON_LOCK.parent.mkdir(parents=True, exist_ok=True)
+    fd = os.open(DAEMON_LOCK, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        os.close(fd)
+        return None
+    return fd
+
+
+def start_daemon() -> None:
+    """Start a daemon for the current project in the background.
+
+    Does nothing if a daemon is already running or starting up.
+    """
+    lock_fd = _acquire_lock()
+    if lock_fd is None:
+        return
+    # Release before spawning; the daemon takes the lock itself
+    os.close(lock_fd)
+
+    subprocess.Popen(
+        [sys.executable, "-m", "air.services.agent_daemon"],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        cwd=Path.cwd(),
+        start_new_session=True,
+    )
+
+
+def serve(idle_timeout: float = IDLE_TIMEOUT) -> None:
+    """Serve agent requests until idle for idle_timeout seconds.
+
+    Exits immediately if another daemon already serves this project.
+
+    Args:
+        idle_timeout: Seconds without requests before exiting
+    """
+    lock_fd = _acquire_lock()
+    if lock_fd is None:
+        return
+
+    # Pay the import cost once; forked agents inherit the loaded modules
+    from air.cli import main
+    from air.commands.analyze import analyze  # noqa: F401
+    from air.services.analyzers import ANALYZER_CLASSES, get_analyzer_class
+
+    for analyzer_type in ANALYZER_CLASSES:
+        get_analyzer_class(analyzer_type)
+
+    # Agents are detached; let the kernel reap them
+    signal.signal(signal.SIGCHLD, signal.SIG_IGN)
+
+    # Holding the lock means any existing socket is stale
+    DAEMON_SOCKET.unlink(missing_ok=True)
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        server.bind(str(DAEMON_SOCKET))
+        server.listen()
+        server.settimeout(idle_timeout)
+
+        while True:
+            try:
+                conn, _ = server.accept()
+            except TimeoutError:
+                break
+
+            with conn:
+                conn.settimeout(CONNECT_TIMEOUT)
+                try:
+                    with conn.makefile("rb") as reader:
+                        request = json.loads(reader.readline())
+                except (OSError, ValueError):
+                    continue
+
+                if request.get("air_version") != __version__:
+                    # air was upgraded since the daemon started; let the
+                    # client fall back and stop serving stale code
+                    _reply(conn, {"error": "version mismatch"})
+                    break
+
+                pid = os.fork()
+                if pid == 0:
+                    # The agent must not keep the daemon lock alive
+                    os.close(lock_fd)
+                    server.close()
+                    conn.close()
+                    _run_agent(request, main)
+
+                _reply(conn, {"pid": pid})
+    finally:
+        server.close()
+        DAEMON_SOCKET.unlink(missing_ok=True)
+        os.close(lock_fd)
+
+
+def _reply(conn: socket.socket, response: dict[str, Any]) -> None:
+    """Send a JSON response line, ignoring disconnected clients.
+
+    Args:
+        conn: Client connection
+        response: Response to send
+    """
+    try:
+        conn.sendall(json.dumps(response).encode("utf-8") + b"\n")
+    except OSError:
+        pass
+
+
+def _run_agent(request: dict[str, Any], main: Any) -> None:
+    """Run a background agent in a freshly forked child. Never returns.
+
+    Args:
+        request: Request received from the client
+        main: The air CLI entry point
+    """
+    exit_code = 1
+    try:
+        os.setsid()
+        signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+        os.chdir(request["cwd"])
+
+        # Point the standard streams at the agent's log files
+        for fd, path in ((1, request["stdout"]), (2, request["stderr"])):
+            log_fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            os.dup2(log_fd, fd)
+            os.close(log_fd)
+        devnull = os.open(os.devnull, os.O_RDONLY)
+        os.dup2(devnull, 0)
+        os.close(devnull)
+
+        try:
+            main(args=request["args"], prog_name="air")
+            exit_code = 0
+        except SystemExit as e:
+            exit_code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+    except BaseException:  # noqa: BLE001 - the forked child must reach os._exit
+        traceback.print_exc()
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(exit_code)
+
+
+if __name__ == "__main__":
+    serve()
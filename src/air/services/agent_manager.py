@@ -7,8 +7,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-import psutil
-
+from air.services.agent_daemon import daemon_enabled, start_daemon, submit_to_daemon
 from air.utils.console import success
 from air.utils.paths import safe_filename
 
@@ -51,6 +50,9 @@ def is_process_running(pid: int | None) -> bool:
     if pid is None:
         return False
 
+    # Imported here so commands that never check agents skip loading psutil
+    import psutil
+
     try:
         process = psutil.Process(pid)
         return process.is_running()
@@ -105,20 +107,31 @@ def spawn_background_agent(
         elif value is not None:
             cmd_args.extend([f"--{key}", str(value)])
 
-    # Spawn subprocess in background
-    process = subprocess.Popen(
-        cmd_args,
-        stdout=open(agent_dir / "stdout.log", "w"),
-        stderr=open(agent_dir / "stderr.log", "w"),
-        cwd=Path.cwd(),
-        start_new_session=True,  # Detach from parent
-    )
+    # Prefer the pre-warmed daemon (opt-in), which forks an already-imported
+    # process instead of starting a new interpreter
+    pid = None
+    if daemon_enabled():
+        pid = submit_to_daemon(cmd_args[1:], agent_dir / "stdout.log", agent_dir / "stderr.log")
+        if pid is None:
+            # Start one for later agents; this one runs as a fresh process
+            start_daemon()
+
+    if pid is None:
+        # Spawn subprocess in background
+        process = subprocess.Popen(
+            cmd_args,
+            stdout=open(agent_dir / "stdout.log", "w"),
+            stderr=open(agent_dir / "stderr.log", "w"),
+            cwd=Path.cwd(),
+            start_new_session=True,  # Detach from parent
+        )
+        pid = process.pid
 
     # Update metadata with PID
-    metadata["pid"] = process.pid
+    metadata["pid"] = pid
     (agent_dir / "metadata.json").write_text(json.dumps(metadata, indent=2))
 
-    success(f"Started background agent: {agent_id} (PID: {process.pid})")
+    success(f"Started background agent: {agent_id} (PID: {pid})")
 
 
 def load_agent_metadata(agent_id: str) -> dict[str, Any]:
@@ -248,10 +261,8 @@ def get_agent_progress(agent_id: str) -> str:
 
 import os
 from collections import defaultdict
-from concurrent.futures import ProcessPoolExecutor, as_completed, TimeoutError as FuturesTimeoutError
-from typing import Callable
-
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn, TimeElapsedColumn
+from collections.abc import Callable, Sequence
+from concurrent.futures import as_completed, TimeoutError as FuturesTimeoutError
 
 from air.services.analysis_worker import run_analyzer_subprocess
 from air.services.analyzers.base import AnalyzerResult, Finding, FindingSeverity
@@ -272,6 +283,10 @@ class AnalysisOrchestrator:
             max_workers: Maximum number of parallel processes (defaults to CPU count)
             timeout: Timeout per analyzer in seconds (default: 5 minutes)
         """
+        # Imported here: multiprocessing is only needed once an orchestrator
+        # is created, not on every import of this module
+        from concurrent.futures import ProcessPoolExecutor
+
         self.max_workers = max_workers or os.cpu_count()
         self.timeout = timeout
         self.executor = ProcessPoolExecutor(max_workers=self.max_workers)
@@ -282,12 +297,16 @@ class AnalysisOrchestrator:
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit - cleanup executor."""
+        self.close()
+
+    def close(self) -> None:
+        """Shut down the worker pool."""
         self.executor.shutdown(wait=True)
 
     def analyze_parallel(
         self,
         repo_paths: list[Path],
-        analyzers: list[str],
+        analyzers: Sequence[str],
         include_external: bool = False,
         progress_callback: Callable[[str, str, bool], None] | None = None,
         show_progress: bool = True,
@@ -323,6 +342,9 @@ class AnalysisOrchestrator:
 
         if show_progress:
             import time
+
+            from rich.progress import Progress, SpinnerColumn, TextColumn
+
             start_time = time.time()
 
             # Track completion messages
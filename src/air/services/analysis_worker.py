@@ -8,22 +8,7 @@ import traceback
 from pathlib import Path
 from typing import Any
 
-from air.services.analyzers import (
-    ArchitectureAnalyzer,
-    CodeStructureAnalyzer,
-    PerformanceAnalyzer,
-    QualityAnalyzer,
-    SecurityAnalyzer,
-)
-
-# Analyzer type mapping
-ANALYZER_MAP = {
-    "security": SecurityAnalyzer,
-    "performance": PerformanceAnalyzer,
-    "architecture": ArchitectureAnalyzer,
-    "quality": QualityAnalyzer,
-    "code_structure": CodeStructureAnalyzer,
-}
+from air.services.analyzers import ANALYZER_CLASSES, get_analyzer_class
 
 
 def run_analyzer_subprocess(
@@ -52,14 +37,14 @@ def run_analyzer_subprocess(
 
     try:
         # Validate analyzer type
-        if analyzer_type not in ANALYZER_MAP:
+        if analyzer_type not in ANALYZER_CLASSES:
             raise ValueError(
                 f"Unknown analyzer type: {analyzer_type}. "
-                f"Valid types: {', '.join(ANALYZER_MAP.keys())}"
+                f"Valid types: {', '.join(ANALYZER_CLASSES.keys())}"
             )
 
-        # Get analyzer class and instantiate
-        analyzer_class = ANALYZER_MAP[analyzer_type]
+        # Get analyzer class (importing only its module) and instantiate
+        analyzer_class = get_analyzer_class(analyzer_type)
         repo_path_obj = Path(repo_path).expanduser().resolve()
 
         if not repo_path_obj.exists():
@@ -115,7 +100,7 @@ def main():
     import argparse
 
     parser = argparse.ArgumentParser(description="Run analyzer in subprocess")
-    parser.add_argument("analyzer_type", choices=ANALYZER_MAP.keys(), help="Analyzer to run")
+    parser.add_argument("analyzer_type", choices=ANALYZER_CLASSES.keys(), help="Analyzer to run")
     parser.add_argument("repo_path", help="Path to repository")
     parser.add_argument(
         "--include-external",
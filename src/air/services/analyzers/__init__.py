@@ -1,11 +1,30 @@
-"""Code analysis services for deep repository inspection."""
+"""Code analysis services for deep repository inspection.
 
-from .base import AnalyzerResult, BaseAnalyzer, Finding, FindingSeverity
-from .code_structure import CodeStructureAnalyzer
-from .security import SecurityAnalyzer
-from .architecture import ArchitectureAnalyzer
-from .quality import QualityAnalyzer
-from .performance import PerformanceAnalyzer
+Analyzer classes are imported on first attribute access so that running one
+analyzer does not import every other analyzer module.
+"""
+
+import importlib
+
+from .base import AnalyzerResult, BaseAnalyzer, Finding, FindingSeverity, build_file_index
+
+# Analyzer class name -> submodule defining it
+_ANALYZER_MODULES = {
+    "CodeStructureAnalyzer": "code_structure",
+    "SecurityAnalyzer": "security",
+    "ArchitectureAnalyzer": "architecture",
+    "QualityAnalyzer": "quality",
+    "PerformanceAnalyzer": "performance",
+}
+
+# Analyzer type (as used by --focus and workers) -> analyzer class name
+ANALYZER_CLASSES = {
+    "security": "SecurityAnalyzer",
+    "performance": "PerformanceAnalyzer",
+    "architecture": "ArchitectureAnalyzer",
+    "quality": "QualityAnalyzer",
+    "code_structure": "CodeStructureAnalyzer",
+}
 
 __all__ = [
     "AnalyzerResult",
@@ -17,4 +36,31 @@ __all__ = [
     "ArchitectureAnalyzer",
     "QualityAnalyzer",
     "PerformanceAnalyzer",
+    "ANALYZER_CLASSES",
+    "build_file_index",
+    "get_analyzer_class",
 ]
+
+
+def get_analyzer_class(analyzer_type: str) -> type[BaseAnalyzer]:
+    """Get the analyzer class for an analyzer type, importing only its module.
+
+    Args:
+        analyzer_type: Analyzer type (security, performance, etc.)
+
+    Returns:
+        Analyzer class
+
+    Raises:
+        KeyError: If analyzer_type is unknown
+    """
+    return __getattr__(ANALYZER_CLASSES[analyzer_type])
+
+
+def __getattr__(name: str) -> type[BaseAnalyzer]:
+    if name in _ANALYZER_MODULES:
+        module = importlib.import_module(f".{_ANALYZER_MODULES[name]}", __name__)
+        analyzer_class: type[BaseAnalyzer] = getattr(module, name)
+        globals()[name] = analyzer_class
+        return analyzer_class
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
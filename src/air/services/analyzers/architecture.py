@@ -6,18 +6,29 @@ from pathlib import Path
 from air.services.path_filter import should_exclude_path
 from .base import AnalyzerResult, BaseAnalyzer, Finding, FindingSeverity
 
+# Patterns compiled once per process rather than per file scanned
+UNPINNED_REQUIREMENT_RE = re.compile(r'^([a-zA-Z0-9_-]+)\s*$', re.MULTILINE)
+FROM_IMPORT_RE = re.compile(r'from\s+(\S+)\s+import')
+IMPORT_RE = re.compile(r'import\s+(\S+)')
+
 
 class ArchitectureAnalyzer(BaseAnalyzer):
     """Analyzes architecture and dependencies."""
 
-    def __init__(self, repo_path: Path, include_external: bool = False):
+    def __init__(
+        self,
+        repo_path: Path,
+        include_external: bool = False,
+        file_index: list[Path] | None = None,
+    ):
         """Initialize architecture analyzer.
 
         Args:
             repo_path: Path to repository
             include_external: If True, include external/vendor code in analysis
+            file_index: Files from build_file_index (walks the tree if not given)
         """
-        super().__init__(repo_path)
+        super().__init__(repo_path, file_index)
         self.repo_path = repo_path
         self.include_external = include_external
 
@@ -63,15 +74,15 @@ class ArchitectureAnalyzer(BaseAnalyzer):
         findings = []
 
         # Check Python dependencies
-        requirements_files = list(self.resource_path.glob("*requirements*.txt"))
-        requirements_files.extend(self.resource_path.glob("pyproject.toml"))
+        requirements_files = self._get_files_by_pattern("*requirements*.txt")
+        requirements_files.extend(self._get_files_by_pattern("pyproject.toml"))
 
         for req_file in requirements_files:
             content = self._read_file(req_file)
 
             # Check for unpinned dependencies
             if req_file.suffix == ".txt":
-                unpinned = re.findall(r'^([a-zA-Z0-9_-]+)\s*$', content, re.MULTILINE)
+                unpinned = UNPINNED_REQUIREMENT_RE.findall(content)
                 if unpinned:
                     findings.append(
                         Finding(
@@ -128,8 +139,8 @@ class ArchitectureAnalyzer(BaseAnalyzer):
                 continue
 
             content = self._read_file(py_file)
-            imports = re.findall(r'from\s+(\S+)\s+import', content)
-            imports.extend(re.findall(r'import\s+(\S+)', content))
+            imports = FROM_IMPORT_RE.findall(content)
+            imports.extend(IMPORT_RE.findall(content))
 
             module_name = str(py_file.relative_to(self.resource_path)).replace("/", ".").replace(".py", "")
             import_graph[module_name] = imports
@@ -1,10 +1,18 @@
 """Base analyzer interface and data structures."""
 
+import os
+import re
+import sys
 from abc import ABC, abstractmethod
 from enum import StrEnum
+from functools import cache
 from pathlib import Path
 from typing import Any
 
+from air.services.path_filter import DEFAULT_EXCLUSIONS
+
+_EXCLUDED_DIRS = frozenset(DEFAULT_EXCLUSIONS)
+
 
 class FindingSeverity(StrEnum):
     """Severity levels for findings."""
@@ -16,9 +24,28 @@ class FindingSeverity(StrEnum):
     INFO = "info"
 
 
+# One shared str per severity: every serialized finding reuses the same
+# object, and lookups skip the slower Enum .value descriptor
+_SEVERITY_VALUES: dict[str, str] = {
+    severity: sys.intern(severity.value) for severity in FindingSeverity.__members__.values()
+}
+
+
 class Finding:
     """A single finding from analysis."""
 
+    # Analyzers create thousands of these; slots avoid a per-instance __dict__
+    __slots__ = (
+        "category",
+        "description",
+        "line_number",
+        "location",
+        "metadata",
+        "severity",
+        "suggestion",
+        "title",
+    )
+
     def __init__(
         self,
         category: str,
@@ -55,7 +82,7 @@ class Finding:
         """Convert to dictionary."""
         return {
             "category": self.category,
-            "severity": self.severity.value,
+            "severity": _SEVERITY_VALUES[self.severity],
             "title": self.title,
             "description": self.description,
             "location": self.location,
@@ -92,22 +119,95 @@ class AnalyzerResult:
         """Convert to dictionary."""
         return {
             "analyzer": self.analyzer_name,
-            "findings": [f.to_dict() for f in self.findings],
+            "findings": list(map(Finding.to_dict, self.findings)),
             "summary": self.summary,
             "metadata": self.metadata,
         }
 
 
+def build_file_index(resource_path: Path, include_external: bool = False) -> list[Path]:
+    """List every file in a repository with a single os.scandir walk.
+
+    The index can be shared by several analyzers so each one does not walk
+    the tree again. Symlinked directories are not followed.
+
+    Args:
+        resource_path: Path to repository
+        include_external: If False, skip excluded (external/vendor) directories
+
+    Returns:
+        List of file paths under resource_path
+    """
+    files = []
+    pending = [str(resource_path)]
+
+    # Depth-first, each directory's files before its subdirectories, which
+    # is the order pathlib's glob("**/...") yields them in
+    while pending:
+        subdirs = []
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if include_external or entry.name not in _EXCLUDED_DIRS:
+                            subdirs.append(entry.path)
+                    elif entry.is_file():
+                        files.append(Path(entry.path))
+        except OSError:
+            continue
+        pending.extend(reversed(subdirs))
+
+    return files
+
+
+@cache
+def _compile_glob(pattern: str) -> re.Pattern[str]:
+    """Compile a pathlib-style glob pattern to match relative POSIX paths.
+
+    Args:
+        pattern: Glob pattern (e.g., "**/*.py")
+
+    Returns:
+        Compiled regex to fullmatch against relative paths
+    """
+    segments = pattern.split("/")
+    regex = ""
+    for i, segment in enumerate(segments):
+        if segment == "**":
+            # Zero or more directories
+            regex += "(?:[^/]+/)*"
+            continue
+        for char in segment:
+            if char == "*":
+                regex += "[^/]*"
+            elif char == "?":
+                regex += "[^/]"
+            else:
+                regex += re.escape(char)
+        if i < len(segments) - 1:
+            regex += "/"
+    return re.compile(regex)
+
+
 class BaseAnalyzer(ABC):
     """Base class for all analyzers."""
 
-    def __init__(self, resource_path: Path):
+    def __init__(
+        self,
+        resource_path: Path,
+        file_index: list[Path] | None = None,
+        include_external: bool = False,
+    ):
         """Initialize analyzer.
 
         Args:
             resource_path: Path to resource to analyze
+            file_index: Files from build_file_index (walks the tree if not given)
+            include_external: If True, include external/vendor code in analysis
         """
         self.resource_path = resource_path
+        self.file_index = file_index
+        self.include_external = include_external
 
     @abstractmethod
     def analyze(self) -> AnalyzerResult:
@@ -163,7 +263,29 @@ class BaseAnalyzer(ABC):
         Returns:
             List of matching file paths
         """
+        if self.file_index is not None:
+            regex = _compile_glob(pattern)
+            root = len(str(self.resource_path)) + 1
+            return [
+                file_path for file_path in self.file_index
+                if regex.fullmatch(file_path.as_posix()[root:])
+            ]
+
         try:
             return list(self.resource_path.glob(pattern))
         except Exception:
             return []
+
+    def _get_all_files(self) -> list[Path]:
+        """Get every file in the resource.
+
+        Returns:
+            List of file paths
+        """
+        if self.file_index is not None:
+            return self.file_index
+
+        return [
+            file_path for file_path in self.resource_path.rglob("*")
+            if file_path.is_file()
+        ]
@@ -9,14 +9,20 @@ from .base import AnalyzerResult, BaseAnalyzer, Finding, FindingSeverity
 class CodeStructureAnalyzer(BaseAnalyzer):
     """Analyzes code structure and basic metrics."""
 
-    def __init__(self, repo_path: Path, include_external: bool = False):
+    def __init__(
+        self,
+        repo_path: Path,
+        include_external: bool = False,
+        file_index: list[Path] | None = None,
+    ):
         """Initialize code structure analyzer.
 
         Args:
             repo_path: Path to repository
             include_external: If True, include external/vendor code in analysis
+            file_index: Files from build_file_index (walks the tree if not given)
         """
-        super().__init__(repo_path)
+        super().__init__(repo_path, file_index)
         self.repo_path = repo_path
         self.include_external = include_external
 
@@ -91,10 +97,7 @@ class CodeStructureAnalyzer(BaseAnalyzer):
             ".rb", ".php", ".cs", ".swift", ".kt", ".cpp", ".c", ".h"
         }
 
-        for file_path in self.resource_path.rglob("*"):
-            if not file_path.is_file():
-                continue
-
+        for file_path in self._get_all_files():
             # Use path_filter to exclude external code
             rel_path = file_path.relative_to(self.repo_path)
             if should_exclude_path(rel_path, self.include_external):
@@ -142,10 +145,7 @@ class CodeStructureAnalyzer(BaseAnalyzer):
             ".rb", ".php", ".cs", ".swift", ".kt"
         }
 
-        for file_path in self.resource_path.rglob("*"):
-            if not file_path.is_file():
-                continue
-
+        for file_path in self._get_all_files():
             # Skip tests and non-code files
             if file_path.suffix.lower() not in code_extensions:
                 continue
@@ -6,18 +6,39 @@ from pathlib import Path
 from air.services.path_filter import should_exclude_path
 from .base import AnalyzerResult, BaseAnalyzer, Finding, FindingSeverity
 
+# Patterns compiled once per process rather than per line or file scanned
+DJANGO_QUERYSET_LOOP_RE = re.compile(r'for\s+\w+\s+in\s+\w+\.(?:objects\.)?(?:all|filter)\(')
+RELATED_ACCESS_RE = re.compile(r'\.\w+\.(?:all|filter|get)\(')
+OUTER_FOR_RE = re.compile(r'^\s*for\s+\w+\s+in\s+')
+INNER_FOR_RE = re.compile(r'for\s+\w+\s+in\s+')
+STRING_CONCAT_LOOP_RE = re.compile(
+    r'(\w+)\s*=\s*["\'][\'"]\s*\n.*for\s+\w+.*:\s*\n.*\1\s*\+=', re.MULTILINE
+)
+LIST_APPEND_LOOP_RE = re.compile(
+    r'(\w+)\s*=\s*\[\]\s*\n.*for\s+(\w+)\s+in\s+.*:\s*\n.*\1\.append\(', re.MULTILINE
+)
+UNPAGINATED_QUERY_RE = re.compile(r'\.objects\.all\(\)(?!\[)')
+FUNCTION_COMPONENT_RE = re.compile(r'function\s+\w+\s*\([^)]*\)\s*{')
+FOREACH_PUSH_RE = re.compile(r'\.forEach\([^)]*push\(')
+
 
 class PerformanceAnalyzer(BaseAnalyzer):
     """Analyzes code for performance issues."""
 
-    def __init__(self, repo_path: Path, include_external: bool = False):
+    def __init__(
+        self,
+        repo_path: Path,
+        include_external: bool = False,
+        file_index: list[Path] | None = None,
+    ):
         """Initialize performance analyzer.
 
         Args:
             repo_path: Path to repository
             include_external: If True, include external/vendor code in analysis
+            file_index: Files from build_file_index (walks the tree if not given)
         """
-        super().__init__(repo_path)
+        super().__init__(repo_path, file_index)
         self.repo_path = repo_path
         self.include_external = include_external
 
@@ -100,10 +121,10 @@ class PerformanceAnalyzer(BaseAnalyzer):
         lines = content.split("\n")
         for i, line in enumerate(lines):
             # Django ORM pattern
-            if re.search(r'for\s+\w+\s+in\s+\w+\.(?:objects\.)?(?:all|filter)\(', line):
+            if DJANGO_QUERYSET_LOOP_RE.search(line):
                 # Check next 10 lines for related object access
                 for j in range(i + 1, min(i + 11, len(lines))):
-                    if re.search(r'\.\w+\.(?:all|filter|get)\(', lines[j]):
+                    if RELATED_ACCESS_RE.search(lines[j]):
                         findings.append(
                             Finding(
                                 category="performance",
@@ -130,7 +151,7 @@ class PerformanceAnalyzer(BaseAnalyzer):
             line = lines[i]
 
             # Match outer for loop
-            if re.search(r'^\s*for\s+\w+\s+in\s+', line):
+            if OUTER_FOR_RE.search(line):
                 outer_indent = len(line) - len(line.lstrip())
 
                 # Look for nested for loop
@@ -140,7 +161,7 @@ class PerformanceAnalyzer(BaseAnalyzer):
 
                     # Check if this is a nested loop at deeper indent
                     if (inner_indent > outer_indent and
-                        re.search(r'for\s+\w+\s+in\s+', inner_line)):
+                        INNER_FOR_RE.search(inner_line)):
 
                         findings.append(
                             Finding(
@@ -165,7 +186,7 @@ class PerformanceAnalyzer(BaseAnalyzer):
         findings = []
 
         # Pattern: result = ""; for x in y: result += x
-        if re.search(r'(\w+)\s*=\s*["\'][\'"]\s*\n.*for\s+\w+.*:\s*\n.*\1\s*\+=', content, re.MULTILINE):
+        if STRING_CONCAT_LOOP_RE.search(content):
             findings.append(
                 Finding(
                     category="performance",
@@ -185,9 +206,7 @@ class PerformanceAnalyzer(BaseAnalyzer):
         findings = []
 
         # Pattern: result = []; for x in y: result.append(transform(x))
-        pattern = r'(\w+)\s*=\s*\[\]\s*\n.*for\s+(\w+)\s+in\s+.*:\s*\n.*\1\.append\('
-
-        if re.search(pattern, content, re.MULTILINE):
+        if LIST_APPEND_LOOP_RE.search(content):
             findings.append(
                 Finding(
                     category="performance",
@@ -207,7 +226,7 @@ class PerformanceAnalyzer(BaseAnalyzer):
         findings = []
 
         # Django: .all() without [:limit] or pagination
-        if re.search(r'\.objects\.all\(\)(?!\[)', content):
+        if UNPAGINATED_QUERY_RE.search(content):
             findings.append(
                 Finding(
                     category="performance",
@@ -238,7 +257,7 @@ class PerformanceAnalyzer(BaseAnalyzer):
                 # Detect missing React.memo or useMemo
                 if "React" in content:
                     # Component without memo
-                    if re.search(r'function\s+\w+\s*\([^)]*\)\s*{', content):
+                    if FUNCTION_COMPONENT_RE.search(content):
                         if "React.memo" not in content and "useMemo" not in content:
                             findings.append(
                                 Finding(
@@ -253,7 +272,7 @@ class PerformanceAnalyzer(BaseAnalyzer):
                             )
 
                 # Detect forEach instead of map
-                if re.search(r'\.forEach\([^)]*push\(', content):
+                if FOREACH_PUSH_RE.search(content):
                     findings.append(
                         Finding(
                             category="performance",
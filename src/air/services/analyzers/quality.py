@@ -6,18 +6,30 @@ from pathlib import Path
 from air.services.path_filter import should_exclude_path
 from .base import AnalyzerResult, BaseAnalyzer, Finding, FindingSeverity
 
+# Patterns compiled once per process rather than per line or file scanned
+FUNCTION_DEF_RE = re.compile(r'def\s+(\w+)\s*\(')
+FUNCTION_SIGNATURE_RE = re.compile(r'def\s+(\w+)\s*\(([^)]*)\)')
+TOP_LEVEL_DEF_RE = re.compile(r'^def\s+\w+', re.MULTILINE)
+DOCSTRING_RE = re.compile(r'"""[^"]')
+
 
 class QualityAnalyzer(BaseAnalyzer):
     """Analyzes code quality."""
 
-    def __init__(self, repo_path: Path, include_external: bool = False):
+    def __init__(
+        self,
+        repo_path: Path,
+        include_external: bool = False,
+        file_index: list[Path] | None = None,
+    ):
         """Initialize quality analyzer.
 
         Args:
             repo_path: Path to repository
             include_external: If True, include external/vendor code in analysis
+            file_index: Files from build_file_index (walks the tree if not given)
         """
-        super().__init__(repo_path)
+        super().__init__(repo_path, file_index)
         self.repo_path = repo_path
         self.include_external = include_external
 
@@ -142,7 +154,7 @@ class QualityAnalyzer(BaseAnalyzer):
             line = lines[i].strip()
 
             # Match function definition
-            match = re.match(r'def\s+(\w+)\s*\(', line)
+            match = FUNCTION_DEF_RE.match(line)
             if match:
                 func_name = match.group(1)
                 func_start = i
@@ -182,8 +194,7 @@ class QualityAnalyzer(BaseAnalyzer):
         results = []
 
         # Match function definitions
-        pattern = r'def\s+(\w+)\s*\(([^)]*)\)'
-        matches = re.finditer(pattern, content)
+        matches = FUNCTION_SIGNATURE_RE.finditer(content)
 
         for match in matches:
             func_name = match.group(1)
@@ -239,10 +250,10 @@ class QualityAnalyzer(BaseAnalyzer):
             content = self._read_file(py_file)
 
             # Count functions
-            func_count = len(re.findall(r'^def\s+\w+', content, re.MULTILINE))
+            func_count = len(TOP_LEVEL_DEF_RE.findall(content))
 
             # Count docstrings
-            docstring_count = len(re.findall(r'"""[^"]', content))
+            docstring_count = len(DOCSTRING_RE.findall(content))
 
             if func_count > 3 and docstring_count < func_count * 0.5:
                 undocumented += 1
@@ -2,22 +2,31 @@
 
 import re
 from pathlib import Path
+from typing import ClassVar
 
 from air.services.path_filter import should_exclude_path
 from .base import AnalyzerResult, BaseAnalyzer, Finding, FindingSeverity
 
+JS_API_KEY_RE = re.compile(r'(apiKey|api_key|apiSecret)\s*[:=]\s*["\'][^"\']{10,}["\']', re.IGNORECASE)
+
 
 class SecurityAnalyzer(BaseAnalyzer):
     """Analyzes code for common security issues."""
 
-    def __init__(self, repo_path: Path, include_external: bool = False):
+    def __init__(
+        self,
+        repo_path: Path,
+        include_external: bool = False,
+        file_index: list[Path] | None = None,
+    ):
         """Initialize security analyzer.
 
         Args:
             repo_path: Path to repository
             include_external: If True, include external/vendor code in analysis
+            file_index: Files from build_file_index (walks the tree if not given)
         """
-        super().__init__(repo_path)
+        super().__init__(repo_path, file_index)
         self.repo_path = repo_path
         self.include_external = include_external
 
@@ -178,6 +187,12 @@ class SecurityAnalyzer(BaseAnalyzer):
         },
     }
 
+    # Patterns compiled once per process rather than per file scanned
+    COMPILED_PATTERNS: ClassVar[dict[str, list[re.Pattern[str]]]] = {
+        pattern_name: [re.compile(pattern, re.IGNORECASE) for pattern in pattern_info["patterns"]]
+        for pattern_name, pattern_info in SECURITY_PATTERNS.items()
+    }
+
     def analyze(self) -> AnalyzerResult:
         """Analyze code for security issues.
 
@@ -251,7 +266,7 @@ class SecurityAnalyzer(BaseAnalyzer):
                     continue
 
                 # Check for hardcoded API keys
-                if re.search(r'(apiKey|api_key|apiSecret)\s*[:=]\s*["\'][^"\']{10,}["\']', content, re.IGNORECASE):
+                if JS_API_KEY_RE.search(content):
                     findings.append(
                         Finding(
                             category="security",
@@ -278,8 +293,8 @@ class SecurityAnalyzer(BaseAnalyzer):
         findings = []
 
         for pattern_name, pattern_info in self.SECURITY_PATTERNS.items():
-            for pattern in pattern_info["patterns"]:
-                matches = re.finditer(pattern, content, re.IGNORECASE)
+            for regex in self.COMPILED_PATTERNS[pattern_name]:
+                matches = regex.finditer(content)
                 for match in matches:
                     # Calculate line number
                     line_num = content[:match.start()].count("\n") + 1
@@ -2,6 +2,7 @@
 
 import hashlib
 import json
+import os
 import shutil
 from datetime import datetime
 from pathlib import Path
@@ -10,6 +11,19 @@ from typing import Any
 from air.services.analyzers.base import AnalyzerResult, Finding, FindingSeverity
 
 
+def get_repo_marker(repo_path: Path) -> Path:
+    """Get the path whose changes invalidate cached results for a repo.
+
+    Args:
+        repo_path: Path to repository
+
+    Returns:
+        The repo's .git entry if present, otherwise the repo directory
+    """
+    git_dir = repo_path / ".git"
+    return git_dir if git_dir.exists() else repo_path
+
+
 class CacheMetadata:
     """Metadata for cached analysis results."""
 
@@ -220,20 +234,122 @@ class CacheManager:
             self._record_miss()
             return None
 
+        result = self._load_cached_result(
+            cache_path, metadata_path, self.compute_file_hash(file_path)
+        )
+        if result is None:
+            self._record_miss()
+        else:
+            self._record_hit()
+        return result
+
+    def get_cached_analyses(
+        self, repo_path: Path, file_path: Path, analyzer_names: list[str]
+    ) -> dict[str, AnalyzerResult | None]:
+        """Get cached analysis results for several analyzers at once.
+
+        Lists the repo's cache directory once and hashes the file once,
+        instead of probing the cache separately for every analyzer.
+
+        Args:
+            repo_path: Path to repository
+            file_path: Path to analyzed file
+            analyzer_names: Names of analyzers to look up
+
+        Returns:
+            Mapping of analyzer name to cached AnalyzerResult, or None if not cached/invalid
+        """
+        repo_cache_dir = self.cache_dir / self._compute_repo_hash(repo_path)
+        try:
+            with os.scandir(repo_cache_dir) as entries:
+                cached_files = {entry.name for entry in entries}
+        except OSError:
+            cached_files = set()
+
+        file_hash = self.compute_file_hash(file_path)
+        results: dict[str, AnalyzerResult | None] = {}
+        for analyzer_name in analyzer_names:
+            cache_filename = f"{file_hash}-{analyzer_name}.json"
+            metadata_filename = f"{file_hash}-{analyzer_name}.meta.json"
+            if cache_filename in cached_files and metadata_filename in cached_files:
+                results[analyzer_name] = self._load_cached_result(
+                    repo_cache_dir / cache_filename,
+                    repo_cache_dir / metadata_filename,
+                    file_hash,
+                )
+            else:
+                results[analyzer_name] = None
+
+        hits = sum(result is not None for result in results.values())
+        self._update_stats(hits=hits, misses=len(results) - hits)
+        return results
+
+    def is_fully_cached(
+        self, repo_path: Path, file_path: Path, analyzer_names: list[str]
+    ) -> bool:
+        """Check whether every analyzer has a valid cached result.
+
+        Only the metadata is read; cached results are not loaded and hit/miss
+        statistics are not updated.
+
+        Args:
+            repo_path: Path to repository
+            file_path: Path to analyzed file
+            analyzer_names: Names of analyzers to check
+
+        Returns:
+            True if all analyzers have valid cached results
+        """
+        repo_cache_dir = self.cache_dir / self._compute_repo_hash(repo_path)
+        try:
+            with os.scandir(repo_cache_dir) as entries:
+                cached_files = {entry.name for entry in entries}
+        except OSError:
+            return False
+
+        file_hash = self.compute_file_hash(file_path)
+        for analyzer_name in analyzer_names:
+            cache_filename = f"{file_hash}-{analyzer_name}.json"
+            metadata_filename = f"{file_hash}-{analyzer_name}.meta.json"
+            if cache_filename not in cached_files or metadata_filename not in cached_files:
+                return False
+
+            try:
+                metadata = CacheMetadata.from_dict(
+                    json.loads((repo_cache_dir / metadata_filename).read_text())
+                )
+            except (OSError, ValueError, KeyError, TypeError):
+                return False
+
+            if metadata.file_hash != file_hash or metadata.air_version != self.air_version:
+                return False
+
+        return True
+
+    def _load_cached_result(
+        self, cache_path: Path, metadata_path: Path, current_hash: str
+    ) -> AnalyzerResult | None:
+        """Load a cached result if its metadata is still valid.
+
+        Args:
+            cache_path: Path to cache file
+            metadata_path: Path to metadata file
+            current_hash: Current hash of the analyzed file
+
+        Returns:
+            Cached AnalyzerResult or None if invalid
+        """
         try:
             # Load metadata
             metadata = CacheMetadata.from_dict(json.loads(metadata_path.read_text()))
 
             # Validate cache is still valid
-            current_hash = self.compute_file_hash(file_path)
             if current_hash != metadata.file_hash:
                 # File changed, cache invalid
-                self._record_miss()
                 return None
 
             # Check AIR version matches (invalidate on version change)
             if metadata.air_version != self.air_version:
-                self._record_miss()
                 return None
 
             # Load cached result
@@ -261,12 +377,10 @@ class CacheManager:
                 metadata=cache_data.get("metadata", {}),
             )
 
-            self._record_hit()
             return result
 
         except Exception:
             # Cache corrupted or unreadable
-            self._record_miss()
             return None
 
     def set_cached_analysis(
@@ -308,6 +422,55 @@ class CacheManager:
             # Silently fail if we can't cache
             pass
 
+    def get_cached_classification(
+        self, repo_path: Path, marker_path: Path
+    ) -> dict[str, Any] | None:
+        """Get cached classification if the repo marker is unchanged.
+
+        Args:
+            repo_path: Path to repository
+            marker_path: Marker whose mtime invalidates the classification
+
+        Returns:
+            Cached classification dict or None if not cached/invalid
+        """
+        cache_path = self._get_cache_path(repo_path, marker_path, "classification")
+
+        try:
+            cache_data = json.loads(cache_path.read_text())
+            if cache_data["air_version"] != self.air_version:
+                return None
+            if cache_data["marker_mtime"] != marker_path.stat().st_mtime:
+                return None
+            classification: dict[str, Any] = cache_data["classification"]
+            return classification
+        except (OSError, ValueError, KeyError, TypeError):
+            # Missing, corrupted or unreadable cache
+            return None
+
+    def set_cached_classification(
+        self, repo_path: Path, marker_path: Path, classification: dict[str, Any]
+    ) -> None:
+        """Cache classification of a repository.
+
+        Args:
+            repo_path: Path to repository
+            marker_path: Marker whose mtime invalidates the classification
+            classification: Classification data to cache
+        """
+        cache_path = self._get_cache_path(repo_path, marker_path, "classification")
+
+        try:
+            cache_data = {
+                "marker_mtime": marker_path.stat().st_mtime,
+                "air_version": self.air_version,
+                "classification": classification,
+            }
+            cache_path.write_text(json.dumps(cache_data, indent=2))
+        except (OSError, TypeError, ValueError):
+            # Silently fail if we can't cache
+            pass
+
     def invalidate_cache(self, repo_path: Path, file_path: Path | None = None) -> None:
         """Invalidate cached results.
 
@@ -350,11 +513,26 @@ class CacheManager:
         total_entries = 0
         total_size_bytes = 0
 
-        # Count all cache files (exclude metadata and stats files)
-        for cache_file in self.cache_dir.rglob("*.json"):
-            if cache_file.name != "stats.json" and not cache_file.name.endswith(".meta.json"):
-                total_entries += 1
-                total_size_bytes += cache_file.stat().st_size
+        # Count all cache files (exclude metadata and stats files) in one
+        # scandir walk; DirEntry.stat() reuses data from the directory read
+        pending = [str(self.cache_dir)]
+        while pending:
+            try:
+                entries = os.scandir(pending.pop())
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    name = entry.name
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif (
+                        name.endswith(".json")
+                        and name != "stats.json"
+                        and not name.endswith(".meta.json")
+                    ):
+                        total_entries += 1
+                        total_size_bytes += entry.stat().st_size
 
         # Load hit/miss stats
         hit_count = 0
@@ -381,11 +559,11 @@ class CacheManager:
 
     def _record_hit(self) -> None:
         """Record a cache hit."""
-        self._update_stats(hit=True)
+        self._update_stats(hits=1)
 
     def _record_miss(self) -> None:
         """Record a cache miss."""
-        self._update_stats(hit=False)
+        self._update_stats(misses=1)
 
     def _record_clear(self) -> None:
         """Record cache clear."""
@@ -396,11 +574,12 @@ class CacheManager:
         }
         self.stats_file.write_text(json.dumps(stats_data, indent=2))
 
-    def _update_stats(self, hit: bool) -> None:
+    def _update_stats(self, hits: int = 0, misses: int = 0) -> None:
         """Update hit/miss statistics.
 
         Args:
-            hit: True for cache hit, False for miss
+            hits: Number of cache hits to add
+            misses: Number of cache misses to add
         """
         stats_data = {"hit_count": 0, "miss_count": 0, "last_cleared": None}
 
@@ -410,10 +589,8 @@ class CacheManager:
             except Exception:
                 pass
 
-        if hit:
-            stats_data["hit_count"] = stats_data.get("hit_count", 0) + 1
-        else:
-            stats_data["miss_count"] = stats_data.get("miss_count", 0) + 1
+        stats_data["hit_count"] = stats_data.get("hit_count", 0) + hits
+        stats_data["miss_count"] = stats_data.get("miss_count", 0) + misses
 
         try:
             self.stats_file.write_text(json.dumps(stats_data, indent=2))
@@ -1,9 +1,11 @@
 """Resource classification service."""
 
+from functools import lru_cache
 from pathlib import Path
-from typing import NamedTuple
+from typing import Any, NamedTuple
 
 from air.core.models import ResourceType
+from air.services.cache_manager import CacheManager, get_repo_marker
 
 
 class ClassificationResult(NamedTuple):
@@ -252,6 +254,73 @@ def classify_resource(resource_path: Path) -> ClassificationResult:
         )
 
 
+def classification_to_dict(result: ClassificationResult) -> dict[str, Any]:
+    """Convert a classification to a JSON-serializable dict.
+
+    Args:
+        result: Classification result
+
+    Returns:
+        Classification dict (as stored in findings and the cache)
+    """
+    return {
+        "type": result.resource_type.value,
+        "technology_stack": result.technology_stack,
+        "confidence": result.confidence,
+        "languages": result.detected_languages,
+        "frameworks": result.detected_frameworks,
+        "reasoning": result.reasoning,
+    }
+
+
+@lru_cache(maxsize=256)
+def _classify_memoized(path: str, marker_mtime_ns: int) -> ClassificationResult:
+    """Classify a resource, memoized on its path and marker mtime."""
+    return classify_resource(Path(path))
+
+
+def classify_resource_cached(
+    resource_path: Path, cache_manager: CacheManager | None = None
+) -> ClassificationResult:
+    """Classify a resource, reusing earlier results while the repo is unchanged.
+
+    Results are memoized in-process and, when a cache manager is given,
+    persisted in the AIR cache. Both are invalidated when the repo marker
+    (.git or the repo directory) changes.
+
+    Args:
+        resource_path: Path to the resource directory
+        cache_manager: Cache manager for persisting classifications
+
+    Returns:
+        ClassificationResult with type, confidence, and metadata
+    """
+    marker = get_repo_marker(resource_path)
+    try:
+        marker_mtime_ns = marker.stat().st_mtime_ns
+    except OSError:
+        return classify_resource(resource_path)
+
+    if cache_manager:
+        cached = cache_manager.get_cached_classification(resource_path, marker)
+        if cached is not None:
+            return ClassificationResult(
+                resource_type=ResourceType(cached["type"]),
+                technology_stack=cached["technology_stack"],
+                confidence=cached["confidence"],
+                detected_languages=cached["languages"],
+                detected_frameworks=cached["frameworks"],
+                reasoning=cached["reasoning"],
+            )
+
+    result = _classify_memoized(str(resource_path.resolve()), marker_mtime_ns)
+    if cache_manager:
+        cache_manager.set_cached_classification(
+            resource_path, marker, classification_to_dict(result)
+        )
+    return result
+
+
 def _detect_languages(path: Path) -> list[str]:
     """Detect programming languages in repository.
 
@@ -1,5 +1,6 @@
 """Dependency graph building and analysis for multi-repo projects."""
 
+from graphlib import CycleError, TopologicalSorter
 from pathlib import Path
 
 from air.core.models import AirConfig
@@ -25,7 +26,7 @@ def build_dependency_graph(config: AirConfig) -> dict[str, set[str]]:
     repo_packages = {}  # {package_name: repo_name}
 
     for resource in config.get_all_resources():
-        repo_path = Path(resource.path).expanduser()
+        repo_path = resource.absolute_path
 
         # Detect what this repo provides (its package name)
         package_name = detect_package_name(repo_path)
@@ -34,7 +35,7 @@ def build_dependency_graph(config: AirConfig) -> dict[str, set[str]]:
 
     # For each repo, check if it depends on other linked repos
     for resource in config.get_all_resources():
-        repo_path = Path(resource.path).expanduser()
+        repo_path = resource.absolute_path
         deps = detect_dependencies(repo_path)
 
         # Find which linked repos this depends on
@@ -89,6 +90,52 @@ def topological_sort(graph: dict[str, set[str]]) -> list[list[str]]:
     return levels
 
 
+def break_dependency_cycles(
+    graph: dict[str, set[str]],
+    max_iterations: int = 10,
+) -> tuple[dict[str, set[str]], list[dict]]:
+    """Break circular dependencies so the graph can be ordered.
+
+    Each cycle is broken by dropping its closing edge. The input graph is
+    not modified.
+
+    Args:
+        graph: Dependency graph
+        max_iterations: Maximum number of edges to drop
+
+    Returns:
+        Tuple of (acyclic copy of the graph, findings for each dropped edge)
+
+    Raises:
+        CycleError: If cycles remain after max_iterations edges were dropped
+    """
+    acyclic = {repo: set(deps) for repo, deps in graph.items()}
+    findings: list[dict] = []
+
+    for attempt in range(max_iterations + 1):
+        try:
+            TopologicalSorter(acyclic).prepare()
+            return acyclic, findings
+        except CycleError as e:
+            if attempt == max_iterations:
+                raise
+
+            # Each node in the cycle is a dependency of the next one
+            cycle = e.args[1]
+            repo, dependency = cycle[-1], cycle[-2]
+            acyclic[repo].discard(dependency)
+            findings.append({
+                "type": "dependency_cycle",
+                "repo": repo,
+                "dependency": dependency,
+                "cycle": cycle,
+                "severity": "medium",
+                "message": f"Breaking cycle: {repo} -> {dependency} ({' -> '.join(reversed(cycle))})",
+            })
+
+    return acyclic, findings
+
+
 def filter_repos_with_dependencies(graph: dict[str, set[str]]) -> dict[str, set[str]]:
     """Filter to only repos that have dependencies OR are depended upon.
 
@@ -125,16 +172,16 @@ def detect_dependency_gaps(
     gaps = []
 
     # Create repo lookup
-    repos_by_name = {r.name: r for r in config.get_all_resources()}
+    repos_by_name = config.get_resources_by_name()
 
     for repo_name, deps in graph.items():
         if not deps:
             continue
 
-        repo_path = Path(repos_by_name[repo_name].path).expanduser()
+        repo_path = repos_by_name[repo_name].absolute_path
 
         for dep_repo_name in deps:
-            dep_repo_path = Path(repos_by_name[dep_repo_name].path).expanduser()
+            dep_repo_path = repos_by_name[dep_repo_name].absolute_path
 
             # Detect package name of dependency
             dep_package_name = detect_package_name(dep_repo_path)
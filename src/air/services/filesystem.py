@@ -3,6 +3,7 @@
 import json
 import os
 import shutil
+from collections.abc import Mapping
 from pathlib import Path
 from typing import Any
 
@@ -50,6 +51,52 @@ def create_file(path: Path, content: str, overwrite: bool = False) -> None:
         error(f"Failed to create file {path}: {e}", exit_code=2)
 
 
+def batch_write(root: Path, files: Mapping[str, str | bytes]) -> None:
+    """Write several files under a directory, overwriting existing ones.
+
+    Files are grouped by parent directory and each directory is opened once;
+    files are then created relative to that directory handle instead of
+    resolving the full path for every file.
+
+    Args:
+        root: Directory the file paths are relative to
+        files: Mapping of relative file path to content (text is written as UTF-8)
+    """
+    by_directory: dict[Path, list[tuple[str, bytes]]] = {}
+    for relative_path, content in files.items():
+        path = root / relative_path
+        data = content.encode("utf-8") if isinstance(content, str) else content
+        by_directory.setdefault(path.parent, []).append((path.name, data))
+
+    for directory, entries in by_directory.items():
+        try:
+            directory.mkdir(parents=True, exist_ok=True)
+            if os.open in os.supports_dir_fd:
+                _write_in_directory(directory, entries)
+            else:
+                for name, data in entries:
+                    (directory / name).write_bytes(data)
+        except OSError as e:
+            error(f"Failed to write files in {directory}: {e}", exit_code=2)
+
+
+def _write_in_directory(directory: Path, entries: list[tuple[str, bytes]]) -> None:
+    """Write files into a directory through a single directory handle.
+
+    Args:
+        directory: Existing directory to write into
+        entries: (file name, content) pairs
+    """
+    dir_fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        for name, data in entries:
+            fd = os.open(name, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666, dir_fd=dir_fd)
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+    finally:
+        os.close(dir_fd)
+
+
 def create_symlink(source: Path, target: Path, overwrite: bool = False) -> None:
     """Create a symbolic link.
 
@@ -153,6 +200,28 @@ def ensure_empty_directory(path: Path) -> None:
         create_directory(path)
 
 
+def is_project_root(directory: Path) -> bool:
+    """Check whether a directory holds an AIR project.
+
+    Args:
+        directory: Directory to check
+
+    Returns:
+        True if the directory has .air/air-config.json, a legacy
+        air-config.json, or a .air directory
+    """
+    # Check new location first (.air/air-config.json)
+    if (directory / ".air" / "air-config.json").exists():
+        return True
+
+    # Check legacy location for backward compatibility
+    if (directory / "air-config.json").exists():
+        return True
+
+    # Also check for .air directory as indicator
+    return (directory / ".air").is_dir()
+
+
 def get_project_root() -> Path | None:
     """Find the AIR project root by looking for .air/air-config.json.
 
@@ -166,19 +235,7 @@ def get_project_root() -> Path | None:
 
     # Check current directory and all parents
     for directory in [current] + list(current.parents):
-        # Check new location first (.air/air-config.json)
-        new_config_file = directory / ".air" / "air-config.json"
-        if new_config_file.exists():
-            return directory
-
-        # Check legacy location for backward compatibility
-        legacy_config_file = directory / "air-config.json"
-        if legacy_config_file.exists():
-            return directory
-
-        # Also check for .air directory as indicator
-        air_dir = directory / ".air"
-        if air_dir.exists() and air_dir.is_dir():
+        if is_project_root(directory):
             return directory
 
     return None
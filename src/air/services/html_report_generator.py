@@ -1,5 +1,6 @@
 """HTML report generator for analysis findings."""
 
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
 
@@ -12,8 +13,10 @@ def generate_findings_html(findings_list: list[dict], output_path: Path, project
         output_path: Path to write HTML file
         project_name: Name of the project
     """
-    # Group findings by repository
+    # Group findings by repository and calculate summary statistics in one pass
     repos = {}
+    severity_counts = {}
+    category_counts = {}
     for idx, finding in enumerate(findings_list, 1):
         finding["id"] = f"{idx:03d}"
         repo = finding.get("source", "unknown")
@@ -21,10 +24,6 @@ def generate_findings_html(findings_list: list[dict], output_path: Path, project
             repos[repo] = []
         repos[repo].append(finding)
 
-    # Calculate summary statistics
-    severity_counts = {}
-    category_counts = {}
-    for finding in findings_list:
         sev = finding.get("severity", "info")
         cat = finding.get("category", "unknown")
         severity_counts[sev] = severity_counts.get(sev, 0) + 1
@@ -366,10 +365,11 @@ def _render_repo_sections(repos: dict[str, list[dict]], emoji: dict[str, str]) -
 
     for repo, findings in sorted(repos.items()):
         # Calculate repo statistics
-        critical = sum(1 for f in findings if f.get("severity") == "critical")
-        high = sum(1 for f in findings if f.get("severity") == "high")
-        medium = sum(1 for f in findings if f.get("severity") == "medium")
-        low = sum(1 for f in findings if f.get("severity") == "low")
+        counts = Counter(f.get("severity") for f in findings)
+        critical = counts["critical"]
+        high = counts["high"]
+        medium = counts["medium"]
+        low = counts["low"]
 
         sections.append(f'''
         <article id="repo-{repo}" class="repo-section">
@@ -1,6 +1,7 @@
 """Template rendering service for AIR toolkit."""
 
 from datetime import datetime
+from functools import lru_cache
 from importlib import resources
 from pathlib import Path
 from typing import Any
@@ -40,6 +41,23 @@ def get_template_path() -> Path:
         )
 
 
+@lru_cache(maxsize=1)
+def _get_environment() -> Environment:
+    """Get the shared Jinja2 environment for package templates.
+
+    The environment keeps compiled templates, so each template is compiled
+    once per process no matter how many files are rendered from it.
+
+    Returns:
+        Jinja2 environment loading from the templates directory
+    """
+    return Environment(
+        loader=FileSystemLoader(get_template_path()),
+        trim_blocks=True,
+        lstrip_blocks=True,
+    )
+
+
 def render_template(template_name: str, context: dict[str, Any]) -> str:
     """Render a Jinja2 template with given context.
 
@@ -53,14 +71,9 @@ def render_template(template_name: str, context: dict[str, Any]) -> str:
     Raises:
         SystemExit: If template not found or rendering fails
     """
-    template_dir = get_template_path()
+    env = _get_environment()
 
     try:
-        env = Environment(
-            loader=FileSystemLoader(template_dir),
-            trim_blocks=True,
-            lstrip_blocks=True,
-        )
         template = env.get_template(template_name)
         return template.render(**context)
     except Exception as e:
@@ -2,6 +2,7 @@
 
 from .console import console, error, info, success, warn
 from .dates import format_timestamp, parse_task_timestamp
+from .jsonio import dumps_json, read_json, write_json
 from .paths import ensure_dir, expand_path
 
 __all__ = [
@@ -12,6 +13,9 @@ __all__ = [
     "warn",
     "format_timestamp",
     "parse_task_timestamp",
+    "dumps_json",
+    "read_json",
+    "write_json",
     "ensure_dir",
     "expand_path",
 ]
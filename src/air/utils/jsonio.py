@@ -0,0 +1,89 @@
+"""JSON serialization utilities for AIR toolkit.
+
+Uses orjson when it is installed (``pip install air-toolkit[fast]``) and
+falls back to the standard library otherwise. Output is pretty-printed with
+two-space indentation either way. Paths ending in ``.gz`` are gzip-compressed.
+"""
+
+import gzip
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on installed extras
+    orjson = None  # type: ignore[assignment]
+
+# mkstemp creates files as 0600; written files get the usual 0666 & ~umask
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def dumps_json(data: Any) -> bytes:
+    """Serialize data to indented UTF-8 JSON.
+
+    Args:
+        data: JSON-serializable data
+
+    Returns:
+        Encoded JSON document
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2).encode("utf-8")
+
+
+def write_json(path: Path, data: Any, durable: bool = False) -> None:
+    """Write data to a file as indented JSON, atomically.
+
+    The document is written to a temporary file next to the target and moved
+    into place, so readers never see a partially written file and a crash
+    mid-write leaves the previous contents intact.
+
+    Args:
+        path: File to write
+        data: JSON-serializable data
+        durable: If True, fsync the file before moving it into place (for
+            files that must survive a power loss, like air-config.json)
+    """
+    payload = dumps_json(data) + b"\n"
+    if path.suffix == ".gz":
+        # Level 3 trades a little size for much faster compression
+        payload = gzip.compress(payload, compresslevel=3)
+
+    # A unique temp name, so concurrent writers of one file never share it
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        try:
+            os.fchmod(fd, 0o666 & ~_UMASK)
+            view = memoryview(payload)
+            while view:
+                view = view[os.write(fd, view):]
+            if durable:
+                os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def read_json(path: Path) -> Any:
+    """Read a JSON file written by write_json.
+
+    Args:
+        path: File to read (gzip-compressed if it ends in .gz)
+
+    Returns:
+        Parsed JSON data
+    """
+    payload = path.read_bytes()
+    if path.suffix == ".gz":
+        payload = gzip.decompress(payload)
+    if orjson is not None:
+        return orjson.loads(payload)
+    return json.loads(payload)
@@ -104,6 +104,66 @@ class TestAgentCoordination:
         stdout_file = agent_dir / "stdout.log"
         assert stdout_file.exists()
 
+    def test_agent_daemon_fallback(self, isolated_project, monkeypatch):
+        """Test agents fall back to a fresh process when no daemon is running."""
+        from air.services.agent_daemon import daemon_enabled, submit_to_daemon
+
+        os.chdir(isolated_project)
+
+        monkeypatch.delenv("AIR_DAEMON", raising=False)
+        assert not daemon_enabled()
+
+        monkeypatch.setenv("AIR_DAEMON", "1")
+        pid = submit_to_daemon(
+            ["analyze", "repo"],
+            isolated_project / "stdout.log",
+            isolated_project / "stderr.log",
+        )
+        assert pid is None
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="daemon requires fork")
+    def test_agent_daemon_serves_requests(self, isolated_project):
+        """Test one daemon per project forks agents that write their logs."""
+        import subprocess
+        import sys
+
+        from air import __version__
+        from air.services.agent_daemon import DAEMON_SOCKET, submit_to_daemon
+
+        os.chdir(isolated_project)
+        (isolated_project / ".air").mkdir()
+
+        serve_cmd = [
+            sys.executable,
+            "-c",
+            "from air.services.agent_daemon import serve; serve(idle_timeout=30)",
+        ]
+        daemon = subprocess.Popen(serve_cmd, cwd=isolated_project)
+        try:
+            deadline = time.time() + 30
+            while not DAEMON_SOCKET.exists() and time.time() < deadline:
+                time.sleep(0.05)
+            assert DAEMON_SOCKET.exists()
+
+            # A second daemon finds the lock held and exits, leaving the socket
+            subprocess.run(serve_cmd, cwd=isolated_project, timeout=30, check=True)
+            assert DAEMON_SOCKET.exists()
+            assert daemon.poll() is None
+
+            stdout_log = isolated_project / "stdout.log"
+            pid = submit_to_daemon(["--version"], stdout_log, isolated_project / "stderr.log")
+            assert isinstance(pid, int)
+
+            deadline = time.time() + 30
+            while time.time() < deadline:
+                if stdout_log.exists() and __version__ in stdout_log.read_text():
+                    break
+                time.sleep(0.05)
+            assert __version__ in stdout_log.read_text()
+        finally:
+            daemon.terminate()
+            daemon.wait(timeout=10)
+
     def test_status_agents_command(self, runner, isolated_project):
         """Test status --agents command."""
         # Change to temp directory first
@@ -2614,3 +2614,128 @@ class TestClassifyCommand:
 
         assert result.exit_code == 1
         assert "not found" in result.output.lower()
+
+
+class TestAnalyzeMultiRepo:
+    """Tests for air analyze --all."""
+
+    @pytest.fixture
+    def multi_repo_project(self, runner, isolated_project, monkeypatch):
+        """Create a project linking a library, a dependent app and an isolated repo."""
+        libx = isolated_project / "libx"
+        libx.mkdir()
+        (libx / "pyproject.toml").write_text('[project]\nname = "libx"\nversion = "1.2.0"\n')
+        (libx / "libx.py").write_text("def f():\n    pass\n")
+
+        app = isolated_project / "app"
+        app.mkdir()
+        (app / "requirements.txt").write_text("libx==1.0.0\n")
+        (app / "main.py").write_text("import libx\n")
+
+        other = isolated_project / "other"
+        other.mkdir()
+        (other / "x.py").write_text("print(1)\n")
+
+        runner.invoke(main, ["init", "multi", "--mode=review"])
+        project_dir = isolated_project / "multi"
+        monkeypatch.chdir(project_dir)
+
+        for repo in (app, libx, other):
+            runner.invoke(main, ["link", "add", str(repo), "--name", repo.name, "--review"])
+
+        return project_dir
+
+    def test_analyze_all_dependencies_first(self, runner, multi_repo_project):
+        """Test libraries are analyzed before the repos that depend on them."""
+        result = runner.invoke(main, ["analyze", "--all"])
+
+        assert result.exit_code == 0, result.output
+        # Per-repo output from the worker processes is relayed to the CLI
+        assert "[3/3] Analyzing:" in result.output
+
+        reviews = multi_repo_project / "analysis" / "reviews"
+        for name in ("libx", "app", "other"):
+            assert (reviews / f"{name}-findings.json").exists()
+
+        # app can only start once libx has finished and written its findings
+        libx_mtime = (reviews / "libx-findings.json").stat().st_mtime_ns
+        app_mtime = (reviews / "app-findings.json").stat().st_mtime_ns
+        assert libx_mtime <= app_mtime
+
+    def test_analyze_all_reports_gaps(self, runner, multi_repo_project):
+        """Test version gaps between linked repos are reported."""
+        result = runner.invoke(main, ["analyze", "--all", "--no-order"])
+
+        assert result.exit_code == 0, result.output
+        assert "app uses libx@1.0.0 but 1.2.0 is available" in result.output
+
+    def test_analyze_all_parallel(self, runner, multi_repo_project):
+        """Test --parallel analyzes every repo through the shared orchestrator."""
+        result = runner.invoke(main, ["analyze", "--all", "--parallel"])
+
+        assert result.exit_code == 0, result.output
+        assert "[3/3] Analyzing:" in result.output
+
+        reviews = multi_repo_project / "analysis" / "reviews"
+        for name in ("libx", "app", "other"):
+            findings = json.loads((reviews / f"{name}-findings.json").read_text())
+            assert any(f.get("type") == "summary" for f in findings["findings"])
+
+    def test_analyze_gap_refreshes_reused_dependent(self, runner, multi_repo_project):
+        """Test a cached dependent's report picks up a new library version."""
+        libx_project = multi_repo_project.parent / "libx" / "pyproject.toml"
+        app_findings = multi_repo_project / "analysis" / "reviews" / "app-findings.json"
+
+        def version_gaps():
+            findings = json.loads(app_findings.read_text())["findings"]
+            return [f for f in findings if f.get("type") == "version_mismatch"]
+
+        libx_project.write_text('[project]\nname = "libx"\nversion = "1.0.0"\n')
+        result = runner.invoke(main, ["analyze", "--gap", "libx"])
+        assert result.exit_code == 0, result.output
+        assert version_gaps() == []
+
+        for version in ("1.2.0", "1.3.0"):
+            libx_project.write_text(f'[project]\nname = "libx"\nversion = "{version}"\n')
+            result = runner.invoke(main, ["analyze", "--gap", "libx"])
+
+            assert result.exit_code == 0, result.output
+            assert "app: all analyzers cached, reusing findings" in result.output
+            gaps = version_gaps()
+            assert [gap["available_version"] for gap in gaps] == [version]
+
+    def test_analyze_cached_repo_skips_file_index(self, runner, multi_repo_project, monkeypatch):
+        """Test a fully cached analysis does not walk the repository."""
+        result = runner.invoke(main, ["analyze", "other"])
+        assert result.exit_code == 0, result.output
+
+        def fail_build_file_index(*args, **kwargs):
+            raise AssertionError("build_file_index called on a fully cached run")
+
+        monkeypatch.setattr("air.commands.analyze.build_file_index", fail_build_file_index)
+        result = runner.invoke(main, ["analyze", "other"])
+
+        assert result.exit_code == 0, result.output
+        assert "security analysis (cached)" in result.output
+        assert "Running" not in result.output
+
+    def test_analyze_all_breaks_cycles(self, runner, multi_repo_project):
+        """Test a dependency cycle is broken and recorded instead of aborting."""
+        # Make libx depend back on app
+        app = multi_repo_project.parent / "app"
+        (app / "pyproject.toml").write_text('[project]\nname = "app"\nversion = "0.1.0"\n')
+        (multi_repo_project.parent / "libx" / "requirements.txt").write_text("app\n")
+
+        result = runner.invoke(main, ["analyze", "--all"])
+
+        assert result.exit_code == 0, result.output
+        assert "Breaking cycle:" in result.output
+
+        reviews = multi_repo_project / "analysis" / "reviews"
+        cycles = [
+            finding
+            for name in ("libx", "app")
+            for finding in json.loads((reviews / f"{name}-findings.json").read_text())["findings"]
+            if finding.get("type") == "dependency_cycle"
+        ]
+        assert len(cycles) == 1
@@ -1,5 +1,7 @@
 """Tests for code analyzers."""
 
+import subprocess
+import sys
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
@@ -12,6 +14,8 @@ from air.services.analyzers import (
     PerformanceAnalyzer,
     QualityAnalyzer,
     SecurityAnalyzer,
+    build_file_index,
+    get_analyzer_class,
 )
 
 
@@ -297,3 +301,63 @@ class TestIntegration:
         # Should have different categories
         categories = {f.category for f in all_findings}
         assert len(categories) >= 3
+
+
+class TestAnalyzerLoading:
+    """Tests for lazy analyzer loading."""
+
+    def test_get_analyzer_class(self):
+        """Test analyzer types map to their classes."""
+        assert get_analyzer_class("security") is SecurityAnalyzer
+        assert get_analyzer_class("code_structure") is CodeStructureAnalyzer
+
+    def test_get_analyzer_class_unknown(self):
+        """Test unknown analyzer type raises KeyError."""
+        with pytest.raises(KeyError):
+            get_analyzer_class("unknown")
+
+    def test_only_requested_analyzer_is_imported(self):
+        """Test loading one analyzer does not import the others."""
+        code = (
+            "import sys; from air.services.analyzers import get_analyzer_class; "
+            "get_analyzer_class('security'); "
+            "print(sorted(m for m in sys.modules if m.startswith('air.services.analyzers.')))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == (
+            "['air.services.analyzers.base', 'air.services.analyzers.security']"
+        )
+
+
+class TestFileIndex:
+    """Tests for the shared file index."""
+
+    def test_build_file_index_skips_excluded_dirs(self, temp_repo):
+        """Test excluded directories are pruned unless include_external."""
+        (temp_repo / "node_modules" / "pkg").mkdir(parents=True)
+        (temp_repo / "node_modules" / "pkg" / "index.js").write_text("x = 1\n")
+
+        files = {p.relative_to(temp_repo).as_posix() for p in build_file_index(temp_repo)}
+        assert "app.py" in files
+        assert "node_modules/pkg/index.js" not in files
+
+        files = {
+            p.relative_to(temp_repo).as_posix()
+            for p in build_file_index(temp_repo, include_external=True)
+        }
+        assert "node_modules/pkg/index.js" in files
+
+    def test_file_index_matches_glob(self, temp_repo):
+        """Test pattern lookups through the index match pathlib globbing."""
+        (temp_repo / "api" / "v1").mkdir(parents=True)
+        (temp_repo / "api" / "v1" / "routes.py").write_text("pass\n")
+        (temp_repo / "dev-requirements.txt").write_text("pytest\n")
+
+        indexed = SecurityAnalyzer(temp_repo, file_index=build_file_index(temp_repo))
+        walking = SecurityAnalyzer(temp_repo)
+        for pattern in ["**/*.py", "**/api/**/*.py", "*requirements*.txt", "**/app.py"]:
+            assert sorted(indexed._get_files_by_pattern(pattern)) == sorted(
+                walking._get_files_by_pattern(pattern)
+            )
@@ -1,6 +1,7 @@
 """Unit tests for cache manager."""
 
 import json
+import os
 import shutil
 import tempfile
 from datetime import datetime
@@ -328,6 +329,57 @@ class TestCacheManager:
         assert cached_security.summary["type"] == "security"
         assert cached_performance.summary["type"] == "performance"
 
+    def test_get_cached_analyses(
+        self, cache_manager, temp_repo_dir, sample_file, sample_result
+    ):
+        """Test bulk lookup returns cached results and None for misses."""
+        cache_manager.set_cached_analysis(temp_repo_dir, sample_file, sample_result)
+
+        results = cache_manager.get_cached_analyses(
+            temp_repo_dir, sample_file, ["security", "performance"]
+        )
+
+        assert results["security"] is not None
+        assert len(results["security"].findings) == 2
+        assert results["performance"] is None
+
+        stats = cache_manager.get_stats()
+        assert stats.hit_count == 1
+        assert stats.miss_count == 1
+
+    def test_is_fully_cached(
+        self, cache_manager, temp_repo_dir, sample_file, sample_result
+    ):
+        """Test full-cache check requires every analyzer and records no stats."""
+        assert not cache_manager.is_fully_cached(temp_repo_dir, sample_file, ["security"])
+
+        cache_manager.set_cached_analysis(temp_repo_dir, sample_file, sample_result)
+
+        assert cache_manager.is_fully_cached(temp_repo_dir, sample_file, ["security"])
+        assert not cache_manager.is_fully_cached(
+            temp_repo_dir, sample_file, ["security", "performance"]
+        )
+
+        stats = cache_manager.get_stats()
+        assert stats.hit_count == 0
+        assert stats.miss_count == 0
+
+    def test_cache_classification(self, cache_manager, temp_repo_dir):
+        """Test cached classification is invalidated when the marker changes."""
+        marker = temp_repo_dir / ".git"
+        marker.mkdir()
+        classification = {"type": "library", "languages": ["python"]}
+
+        assert cache_manager.get_cached_classification(temp_repo_dir, marker) is None
+
+        cache_manager.set_cached_classification(temp_repo_dir, marker, classification)
+        assert cache_manager.get_cached_classification(temp_repo_dir, marker) == classification
+
+        # Touch marker with a different mtime
+        mtime = marker.stat().st_mtime
+        os.utime(marker, (mtime + 10, mtime + 10))
+        assert cache_manager.get_cached_classification(temp_repo_dir, marker) is None
+
     def test_cache_clear_updates_timestamp(self, cache_manager):
         """Test that clearing cache updates last_cleared timestamp."""
         # Clear cache
@@ -6,7 +6,8 @@ from pathlib import Path
 import pytest
 
 from air.core.models import ResourceType
-from air.services.classifier import classify_resource
+from air.services.cache_manager import CacheManager
+from air.services.classifier import classify_resource, classify_resource_cached
 
 
 class TestLanguageDetection:
@@ -260,3 +261,21 @@ class TestConfidenceScores:
         result = classify_resource(tmp_path)
         # Ambiguous repo with no clear indicators should have low confidence
         assert result.confidence < 0.8
+
+
+class TestCachedClassification:
+    """Test cached classification."""
+
+    def test_cached_classification_persists(self, tmp_path: Path) -> None:
+        """Test classification is stored in and served from the cache."""
+        repo = tmp_path / "repo"
+        repo.mkdir()
+        (repo / "app.py").write_text("print('hello')")
+        cache_manager = CacheManager(cache_dir=tmp_path / "cache")
+
+        result = classify_resource_cached(repo, cache_manager)
+        assert result == classify_resource(repo)
+
+        # A fresh cache manager reads the persisted classification
+        cached = classify_resource_cached(repo, CacheManager(cache_dir=tmp_path / "cache"))
+        assert cached == result
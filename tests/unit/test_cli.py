@@ -0,0 +1,48 @@
+"""Tests for CLI entry point."""
+
+import subprocess
+import sys
+
+import click
+from click.testing import CliRunner
+
+from air.cli import LAZY_SUBCOMMANDS, main
+
+
+def test_help_lists_all_commands():
+    """Test help output lists every lazily registered command."""
+    result = CliRunner().invoke(main, ["--help"])
+
+    assert result.exit_code == 0
+    for name in LAZY_SUBCOMMANDS:
+        assert name in result.output
+
+
+def test_lazy_subcommands_resolve():
+    """Test every lazy subcommand resolves to a click command of the same name."""
+    ctx = click.Context(main)
+    for name in LAZY_SUBCOMMANDS:
+        command = main.get_command(ctx, name)
+        assert command is not None
+        assert command.name == name
+
+
+def test_import_does_not_load_commands():
+    """Test importing the CLI does not import command modules."""
+    code = (
+        "import sys, air.cli; "
+        "print(any(m.startswith('air.commands.') for m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "False"
+
+
+def test_import_does_not_load_rich():
+    """Test importing the CLI does not import rich."""
+    code = "import sys, air.cli; print('rich' in sys.modules)"
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "False"
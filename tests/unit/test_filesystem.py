@@ -4,6 +4,7 @@ import pytest
 from pathlib import Path
 
 from air.services.filesystem import (
+    batch_write,
     create_directory,
     create_file,
     create_symlink,
@@ -74,6 +75,26 @@ def test_create_file_with_overwrite(tmp_path):
     assert test_file.read_text() == new_content
 
 
+def test_batch_write(tmp_path):
+    """Test writing several files grouped by directory."""
+    (tmp_path / "README.md").write_text("Original content")
+
+    batch_write(
+        tmp_path,
+        {
+            "README.md": "New content",
+            ".air/context/architecture.md": "# Architecture",
+            ".air/context/language.md": "# Language",
+            "data.bin": b"\x00\x01",
+        },
+    )
+
+    assert (tmp_path / "README.md").read_text() == "New content"
+    assert (tmp_path / ".air/context/architecture.md").read_text() == "# Architecture"
+    assert (tmp_path / ".air/context/language.md").read_text() == "# Language"
+    assert (tmp_path / "data.bin").read_bytes() == b"\x00\x01"
+
+
 def test_create_symlink(tmp_path):
     """Test symlink creation."""
     source = tmp_path / "source"
@@ -165,6 +186,27 @@ def test_get_project_root_with_ai_dir(tmp_path, monkeypatch):
     assert root == project_dir
 
 
+def test_get_project_root_picks_up_new_projects(tmp_path, monkeypatch):
+    """Test projects created or removed between calls are seen on the next call."""
+    outer = tmp_path / "outer"
+    inner = outer / "inner"
+    inner.mkdir(parents=True)
+    monkeypatch.chdir(inner)
+
+    assert get_project_root() is None
+
+    (outer / ".air").mkdir()
+    assert get_project_root() == outer
+
+    # A project nested between cwd and the outer root takes precedence
+    (inner / ".air").mkdir()
+    assert get_project_root() == inner
+
+    (inner / ".air").rmdir()
+    (outer / ".air").rmdir()
+    assert get_project_root() is None
+
+
 def test_get_project_root_not_found(tmp_path, monkeypatch):
     """Test get_project_root returns None when not in project."""
     monkeypatch.chdir(tmp_path)
@@ -1,7 +1,9 @@
 """Tests for core models."""
 
+import os
 import pytest
 from datetime import datetime
+from pathlib import Path
 
 from air.core.models import (
     AirConfig,
@@ -113,3 +115,48 @@ def test_get_all_resources():
     assert len(all_resources) == 2
     assert any(r.name == "service-a" for r in all_resources)
     assert any(r.name == "architecture" for r in all_resources)
+
+
+def test_resource_absolute_path():
+    """Test resource absolute path is computed once and not resolved."""
+    resource = Resource(
+        name="service-a",
+        path="~/repos/../service-a",
+        type=ResourceType.LIBRARY,
+        relationship=ResourceRelationship.REVIEW_ONLY,
+    )
+
+    assert resource.absolute_path == Path(os.path.abspath(Path.home() / "service-a"))
+    assert resource.absolute_path is resource.absolute_path
+    assert "absolute_path" not in resource.model_dump()
+
+
+def test_get_resources_by_name():
+    """Test indexing resources by name across categories."""
+    config = AirConfig(
+        name="test-project",
+        mode=ProjectMode.MIXED,
+    )
+
+    config.add_resource(
+        Resource(
+            name="service-a",
+            path="/path/to/service-a",
+            type=ResourceType.LIBRARY,
+            relationship=ResourceRelationship.REVIEW_ONLY,
+        ),
+        "review",
+    )
+    config.add_resource(
+        Resource(
+            name="architecture",
+            path="/path/to/architecture",
+            type=ResourceType.DOCUMENTATION,
+            relationship=ResourceRelationship.DEVELOPER,
+        ),
+        "develop",
+    )
+
+    resources_by_name = config.get_resources_by_name()
+    assert set(resources_by_name) == {"service-a", "architecture"}
+    assert resources_by_name["architecture"].type == ResourceType.DOCUMENTATION
@@ -1,9 +1,11 @@
 """Tests for utility modules."""
 
+import json
 from datetime import datetime
 from pathlib import Path
 
 from air.utils.dates import format_timestamp, parse_task_timestamp, format_duration
+from air.utils.jsonio import write_json
 from air.utils.paths import expand_path, safe_filename
 
 
@@ -56,3 +58,15 @@ def test_safe_filename():
     assert safe_filename("My Test File") == "my-test-file"
     assert safe_filename("Test@#$%File") == "testfile"
     assert safe_filename("UPPERCASE") == "uppercase"
+
+
+def test_write_json(tmp_path: Path):
+    """Test JSON files are indented, round-trip and leave no temp file."""
+    data = {"repository": "app", "findings": [{"severity": "high", "line": 3}]}
+    output = tmp_path / "findings.json"
+
+    write_json(output, data)
+
+    assert json.loads(output.read_text()) == data
+    assert '\n  "repository": "app"' in output.read_text()
+    assert list(tmp_path.iterdir()) == [output]